@@ -10,7 +10,7 @@ import click
 import click.shell_completion
 
 from niveshpy.cli.utils import essentials, flags, overrides
-from niveshpy.cli.utils.builders import build_csv, build_table
+from niveshpy.cli.utils.builders import build_csv, build_table, csv_rows, json_data
 from niveshpy.cli.utils.display import (
     capture_for_pager,
     display,
@@ -21,13 +21,12 @@ from niveshpy.cli.utils.display import (
 )
 from niveshpy.cli.utils.formatters import (
     format_date,
-    format_datetime,
     format_decimal,
     format_security,
+    relative_datetime_formatter,
 )
 from niveshpy.cli.utils.models import Column, OutputFormat
 from niveshpy.core.app import AppState
-from niveshpy.core.converter import get_csv_converter, get_json_converter
 from niveshpy.exceptions import InvalidInputError
 
 
@@ -121,7 +120,11 @@ def list_prices(
                 Column(
                     "close", formatter=format_decimal, style="bold", justify="right"
                 ),
-                Column("created", style="dim", formatter=format_datetime),
+                Column(
+                    "created",
+                    style="dim",
+                    formatter=relative_datetime_formatter(),
+                ),
                 Column("source", style="dim"),
             ]
             table = build_table(result, columns)
@@ -133,9 +136,8 @@ def list_prices(
             if extra_message:
                 display(extra_message)
         elif format == OutputFormat.CSV:
-            c = get_csv_converter()
             csv = build_csv(
-                c.unstructure(result),
+                csv_rows(result),
                 fields=[
                     "security",
                     "date",
@@ -151,11 +153,9 @@ def list_prices(
             if csv:
                 display(csv)
         elif format == OutputFormat.JSON:
-            c = get_json_converter()
-            data = c.unstructure(result)
+            data = json_data(result)
             if output_file:
-                with output_file.open("w") as f:
-                    json.dump(data, f, indent=4)
+                output_file.write_text(json.dumps(data, indent=4))
             else:
                 display_json(data=data)
 
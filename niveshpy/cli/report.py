@@ -10,7 +10,7 @@ from typing import Literal
 import click
 
 from niveshpy.cli.utils import essentials, flags
-from niveshpy.cli.utils.builders import build_csv, build_table
+from niveshpy.cli.utils.builders import build_csv, build_table, csv_rows, json_data
 from niveshpy.cli.utils.display import (
     capture_for_pager,
     display,
@@ -30,7 +30,6 @@ from niveshpy.cli.utils.formatters import (
 from niveshpy.cli.utils.models import Column, OutputFormat, SectionBreak, TotalRow
 from niveshpy.cli.utils.overrides import NiveshPyCommand
 from niveshpy.core.app import AppState
-from niveshpy.core.converter import get_csv_converter, get_json_converter
 from niveshpy.core.logging import logger
 from niveshpy.core.query import tokens
 from niveshpy.core.query.tokenizer import QueryLexer
@@ -165,9 +164,8 @@ def holdings(
                 table = build_table(items, columns)
                 display(table)
             elif format == OutputFormat.CSV:
-                c = get_csv_converter()
                 csv = build_csv(
-                    c.unstructure(holdings),
+                    csv_rows(holdings),
                     fields=[
                         "account",
                         "security",
@@ -181,11 +179,9 @@ def holdings(
                 if csv:
                     display(csv)
             elif format == OutputFormat.JSON:
-                c = get_json_converter()
-                data = c.unstructure(holdings)
+                data = json_data(holdings)
                 if output_file:
-                    with output_file.open("w") as f:
-                        json.dump(data, f, indent=4)
+                    output_file.write_text(json.dumps(data, indent=4))
                 else:
                     display_json(data=data)
 
@@ -284,23 +280,22 @@ def allocation(
 
                 display(table)
             elif format == OutputFormat.CSV:
-                c = get_csv_converter()
                 fields = ["date", "amount", "allocation"]
                 if group_by in ("both", "category"):
                     fields.insert(0, "security_category")
                 if group_by in ("both", "type"):
                     fields.insert(0, "security_type")
                 csv = build_csv(
-                    c.unstructure(allocations), fields=fields, output_file=output_file
+                    csv_rows(allocations),
+                    fields=fields,
+                    output_file=output_file,
                 )
                 if csv:
                     display(csv)
             elif format == OutputFormat.JSON:
-                c = get_json_converter()
-                data = c.unstructure(allocations)
+                data = json_data(allocations)
                 if output_file:
-                    with output_file.open("w") as f:
-                        json.dump(data, f, indent=4)
+                    output_file.write_text(json.dumps(data, indent=4))
                 else:
                     display_json(data=data)
 
@@ -413,9 +408,8 @@ def performance(
             table = build_table(table_items, columns)
             display(table)
         elif format == OutputFormat.CSV:
-            c = get_csv_converter()
             csv = build_csv(
-                c.unstructure(result.holdings),
+                csv_rows(result.holdings),
                 fields=[
                     "account",
                     "security",
@@ -431,11 +425,9 @@ def performance(
             if csv:
                 display(csv)
         elif format == OutputFormat.JSON:
-            c = get_json_converter()
-            data = c.unstructure(result.holdings)
+            data = json_data(result.holdings)
             if output_file:
-                with output_file.open("w") as f:
-                    json.dump(data, f, indent=4)
+                output_file.write_text(json.dumps(data, indent=4))
             else:
                 display_json(data=data)
 
@@ -576,10 +568,8 @@ def summary(
                 display(allocation)
         else:
             with capture_for_pager(enabled=output_file is None):
-                c = get_json_converter()
-                data = c.unstructure(result)
+                data = json_data(result)
                 if output_file:
-                    with output_file.open("w") as f:
-                        json.dump(data, f, indent=4)
+                    output_file.write_text(json.dumps(data, indent=4))
                 else:
                     display_json(data=data)
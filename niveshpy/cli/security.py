@@ -7,7 +7,7 @@ from textwrap import dedent
 import click
 
 from niveshpy.cli.utils import essentials, flags
-from niveshpy.cli.utils.builders import build_csv, build_table
+from niveshpy.cli.utils.builders import build_csv, build_table, csv_rows, json_data
 from niveshpy.cli.utils.display import (
     capture_for_pager,
     display,
@@ -18,14 +18,13 @@ from niveshpy.cli.utils.display import (
     loading_spinner,
 )
 from niveshpy.cli.utils.formatters import (
-    format_datetime,
     format_security_category,
     format_security_type,
+    relative_datetime_formatter,
 )
 from niveshpy.cli.utils.models import Column, OutputFormat
 from niveshpy.cli.utils.overrides import command
 from niveshpy.core.app import AppState
-from niveshpy.core.converter import get_csv_converter, get_json_converter
 from niveshpy.core.logging import logger
 from niveshpy.exceptions import InvalidInputError, ResourceNotFoundError
 from niveshpy.models.security import (
@@ -95,27 +94,28 @@ def show(
                 Column("name"),
                 Column("type", formatter=format_security_type),
                 Column("category", formatter=format_security_category),
-                Column("created", style="dim", formatter=format_datetime),
+                Column(
+                    "created",
+                    style="dim",
+                    formatter=relative_datetime_formatter(),
+                ),
                 Column("source", style="dim"),
             ]
 
             table = build_table(result, columns)
             display(table)
         elif format == OutputFormat.CSV:
-            c = get_csv_converter()
             csv = build_csv(
-                c.unstructure(result),
+                csv_rows(result),
                 fields=["key", "name", "type", "category", "created", "source"],
                 output_file=output_file,
             )
             if csv:
                 display(csv)
         elif format == OutputFormat.JSON:
-            c = get_json_converter()
-            data = c.unstructure(result)
+            data = json_data(result)
             if output_file:
-                with output_file.open("w") as f:
-                    json.dump(data, f, indent=4)
+                output_file.write_text(json.dumps(data, indent=4))
             else:
                 display_json(data=data)
 
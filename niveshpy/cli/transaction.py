@@ -10,7 +10,7 @@ import click
 from attrs import evolve
 
 from niveshpy.cli.utils import essentials, flags, inputs
-from niveshpy.cli.utils.builders import build_csv, build_table
+from niveshpy.cli.utils.builders import build_csv, build_table, csv_rows, json_data
 from niveshpy.cli.utils.display import (
     capture_for_pager,
     display,
@@ -23,15 +23,14 @@ from niveshpy.cli.utils.display import (
 from niveshpy.cli.utils.formatters import (
     format_account,
     format_date,
-    format_datetime,
     format_decimal,
     format_security,
     format_transaction_type,
+    relative_datetime_formatter,
 )
 from niveshpy.cli.utils.models import Column, OutputFormat, Row
 from niveshpy.cli.utils.overrides import command
 from niveshpy.core.app import AppState
-from niveshpy.core.converter import get_csv_converter, get_json_converter
 from niveshpy.core.logging import logger
 from niveshpy.exceptions import InvalidInputError, ResourceNotFoundError
 from niveshpy.models.transaction import TransactionType
@@ -127,7 +126,11 @@ def show(
                 Column("amount", formatter=format_decimal, style="bold"),
                 Column("units", formatter=format_decimal, style="cyan"),
                 Column("account", formatter=format_account, style="dim"),
-                Column("created", style="dim", formatter=format_datetime),
+                Column(
+                    "created",
+                    style="dim",
+                    formatter=relative_datetime_formatter(),
+                ),
                 Column("source", style="dim"),
             ]
             if cost:
@@ -158,7 +161,6 @@ def show(
             table = build_table(rows, columns)
             display(table)
         elif format == OutputFormat.CSV:
-            c = get_csv_converter()
             fields = [
                 "id",
                 "transaction_date",
@@ -173,17 +175,13 @@ def show(
             ]
             if cost:
                 fields.insert(6, "cost")
-            csv = build_csv(
-                c.unstructure(result), fields=fields, output_file=output_file
-            )
+            csv = build_csv(csv_rows(result), fields=fields, output_file=output_file)
             if csv:
                 display(csv)
         elif format == OutputFormat.JSON:
-            c = get_json_converter()
-            data = c.unstructure(result)
+            data = json_data(result)
             if output_file:
-                with output_file.open("w") as f:
-                    json.dump(data, f, indent=4)
+                output_file.write_text(json.dumps(data, indent=4))
             else:
                 display_json(data=data)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -33,28 +33,30 @@ def build_table(
             style=column.style,
         )
 
+    # Resolve per-table values once instead of on every row.
+    add_row = table.add_row
+    total_padding = [None] * (len(columns) - 2)
+    converters = [(column.getter or column.get, column.formatter) for column in columns]
+
     for item in items:
-        if isinstance(item, SectionBreak):
+        # Marker types are never subclassed, so exact type checks are enough and
+        # avoid walking the MRO for every plain data row.
+        if type(item) is SectionBreak:
             table.add_section()
-        elif isinstance(item, TotalRow):
-            table.add_row(
+        elif type(item) is TotalRow:
+            add_row(
                 item.description,
-                *([None] * (len(columns) - 2)),
+                *total_padding,
                 str(item.total),
                 style="bold",
             )
-        elif isinstance(item, Row):
-            row = []
-            for column in columns:
-                value = column.get(item.data)
-                row.append(column.format(value))
-            table.add_row(*row, style=item.override_style)
+        elif type(item) is Row:
+            add_row(
+                *[fmt(get(item.data)) for get, fmt in converters],
+                style=item.override_style,
+            )
         else:
-            row = []
-            for column in columns:
-                value = column.get(item)
-                row.append(column.format(value))
-            table.add_row(*row)
+            add_row(*[fmt(get(item)) for get, fmt in converters])
 
     return table
 
@@ -70,23 +72,52 @@ def build_csv(
     Args:
         items: The rows to write to the CSV output.
         fields: The CSV field names to use for the header and row ordering.
+            Missing keys are written as empty values.
         output_file: The file path to write the CSV output to. If not provided,
             the CSV content is built in memory and returned as a string.
 
     Returns:
         The CSV content as a string when ``output_file`` is not provided;
         otherwise, ``None`` after writing the CSV data to ``output_file``.
+
+    Raises:
+        ValueError: If an item has keys that are not listed in ``fields``.
     """
     import csv
     from io import StringIO
 
+    field_set = frozenset(fields)
+
+    def rows() -> Iterator[list[Any]]:
+        for item in items:
+            if not field_set.issuperset(item):
+                # Same check and message as csv.DictWriter(extrasaction="raise").
+                extra = ", ".join(repr(key) for key in item if key not in field_set)
+                raise ValueError(f"dict contains fields not in fieldnames: {extra}")
+            yield [item.get(key, "") for key in fields]
+
     # If output_file is provided, write directly to the file.
     # Otherwise, build the CSV in memory and return it as a string.
     with output_file.open("w", newline="") if output_file else StringIO() as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        writer.writerows(items)
+        # Positional rows with a set-based key check are cheaper than DictWriter.
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(rows())
         if isinstance(f, StringIO):
             return f.getvalue()
 
     return None
+
+
+def csv_rows(items: Iterable[Any]) -> Iterator[Any]:
+    """Lazily unstructure items into rows for CSV output."""
+    from niveshpy.core.converter import get_csv_converter
+
+    return map(get_csv_converter().unstructure, items)
+
+
+def json_data(obj: Any) -> Any:
+    """Unstructure an object into JSON-compatible data."""
+    from niveshpy.core.converter import get_json_converter
+
+    return get_json_converter().unstructure(obj)
@@ -9,6 +9,9 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from rich.console import Console
 
+MAX_HIGHLIGHT_LENGTH = 64 * 1024
+"""Largest JSON output, in characters, that is syntax highlighted on a terminal."""
+
 # Simple printing utilities for the CLI, using Rich for styling and formatting.
 
 
@@ -17,9 +20,9 @@ def display(
 ) -> None:
     """Display objects to the console with optional styling."""
     if not console:
-        from niveshpy.cli.utils.setup import _console
+        from niveshpy.cli.utils.setup import get_console
 
-        console = _console
+        console = get_console()
 
     console.print(*objects, style=style)
 
@@ -29,11 +32,25 @@ def display_json(
 ) -> None:
     """Display JSON data to the console with pretty formatting."""
     if not console:
-        from niveshpy.cli.utils.setup import _console
+        from niveshpy.cli.utils.setup import get_console
+
+        console = get_console()
 
-        console = _console
+    import json as json_lib
 
-    console.print_json(json, data=data)
+    text = (
+        json if json is not None else json_lib.dumps(data, indent=2, ensure_ascii=False)
+    )
+    if console.is_terminal and len(text) <= MAX_HIGHLIGHT_LENGTH:
+        console.print_json(text)
+        return
+
+    if json is not None:
+        # Indent caller-provided JSON the same way print_json does.
+        text = json_lib.dumps(json_lib.loads(json), indent=2, ensure_ascii=False)
+    # Without a terminal there is nothing to highlight, and on large payloads
+    # the highlighter dominates rendering, so print the indented JSON as-is.
+    console.print(text, soft_wrap=True, markup=False, emoji=False, highlight=False)
 
 
 def display_success(message: str, console: Console | None = None) -> None:
@@ -44,9 +61,9 @@ def display_success(message: str, console: Console | None = None) -> None:
 def display_warning(*objects: object, console: Console | None = None) -> None:
     """Display a warning message to the error console."""
     if not console:
-        from niveshpy.cli.utils.setup import _error_console
+        from niveshpy.cli.utils.setup import get_error_console
 
-        console = _error_console
+        console = get_error_console()
 
     display("[bold yellow]Warning:[/bold yellow]", *objects, console=console)
 
@@ -56,9 +73,9 @@ def display_error(
 ) -> None:
     """Display an error message to the error console."""
     if not console:
-        from niveshpy.cli.utils.setup import _error_console
+        from niveshpy.cli.utils.setup import get_error_console
 
-        console = _error_console
+        console = get_error_console()
 
     display(f"[bold red]{tag}[/bold red]", *objects, console=console)
 
@@ -66,6 +83,22 @@ def display_error(
 # Additional utilities for the CLI.
 
 
+def _fits_on_screen(output: str, width: int, height: int) -> bool:
+    """Check whether captured output fits on one screen, including wrapped lines."""
+    if output.count("\n") >= height:
+        # Too many lines even without wrapping; no need to measure them.
+        return False
+
+    from rich.text import Text
+
+    rows = 0
+    for line in Text.from_ansi(output).split("\n"):
+        rows += max(1, -(-line.cell_len // width))
+        if rows >= height:
+            return False
+    return True
+
+
 @contextmanager
 def capture_for_pager(
     console: Console | None = None, enabled: bool = True
@@ -75,20 +108,26 @@ def capture_for_pager(
     Args:
         console: The console to use. If not provided, the default CLI console is used.
         enabled: Whether paging is enabled. When `True`, output is captured and sent
-            through the pager if the console is a terminal. When `False`, paging is
-            disabled even if the console is a terminal.
+            through the pager if the console is a terminal and the output does not
+            fit on one screen. When `False`, paging is disabled even if the console
+            is a terminal.
     """
     if not console:
-        from niveshpy.cli.utils.setup import _console
+        from niveshpy.cli.utils.setup import get_console
 
-        console = _console
+        console = get_console()
 
     if console.is_terminal and enabled:
         import click
 
         with console.capture() as capture:
             yield
-        click.echo_via_pager(capture.get())
+        output = capture.get()
+        if _fits_on_screen(output, console.width, console.height):
+            # Short output fits on screen; skip spawning the pager.
+            click.echo(output, file=console.file, nl=False)
+        else:
+            click.echo_via_pager(output)
     else:
         yield
 
@@ -99,9 +138,9 @@ def loading_spinner(
 ) -> Generator[None, None, None]:
     """Context manager to show a loading spinner with a message."""
     if not console:
-        from niveshpy.cli.utils.setup import _error_console
+        from niveshpy.cli.utils.setup import get_error_console
 
-        console = _error_console
+        console = get_error_console()
 
     if console.is_terminal:
         with console.status(message):
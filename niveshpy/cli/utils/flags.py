@@ -15,6 +15,7 @@ _AnyCallable = Callable[..., Any]
 FC = TypeVar("FC", bound="_AnyCallable | click.Command")
 
 
+@functools.cache
 def limit(name: str, default: int = 30) -> Callable[[FC], FC]:
     """Common limit option for CLI commands."""
     return click.option(
@@ -26,6 +27,7 @@ def limit(name: str, default: int = 30) -> Callable[[FC], FC]:
     )
 
 
+@functools.cache
 def offset(name: str, default: int = 0) -> Callable[[FC], FC]:
     """Common offset option for CLI commands."""
     return click.option(
@@ -36,20 +38,21 @@ def offset(name: str, default: int = 0) -> Callable[[FC], FC]:
     )
 
 
+_STATE_FLAGS = frozenset({"no_input", "debug", "no_color"})
+"""Flag names that are stored on the AppState attribute of the same name."""
+
+
 def _callback(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
     """Callback to handle common flag."""
     logger.debug("Flag %s set to %s", param.name, value)
-    if not ctx.resilient_parsing:
-        state = ctx.ensure_object(AppState)
-        if param.name == "no_input" and value:
-            state.no_input = value
-        elif param.name == "debug" and value:
-            state.debug = value
-        elif param.name == "no_color" and value:
-            state.no_color = value
+    if ctx.resilient_parsing or not value or param.name not in _STATE_FLAGS:
+        return value
+    state = ctx.ensure_object(AppState)
+    setattr(state, param.name, value)
     return value
 
 
+@functools.cache
 def no_input() -> Callable[[FC], FC]:
     """Common no-input option for CLI commands."""
     return click.option(
@@ -61,6 +64,7 @@ def no_input() -> Callable[[FC], FC]:
     )
 
 
+@functools.cache
 def force() -> Callable[[FC], FC]:
     """Common force option for CLI commands."""
     return click.option(
@@ -71,6 +75,7 @@ def force() -> Callable[[FC], FC]:
     )
 
 
+@functools.cache
 def dry_run() -> Callable[[FC], FC]:
     """Common dry-run option for CLI commands."""
     return click.option(
@@ -81,6 +86,7 @@ def dry_run() -> Callable[[FC], FC]:
     )
 
 
+@functools.cache
 def debug() -> Callable[[FC], FC]:
     """Common debug/verbose option for CLI commands."""
     return click.option(
@@ -95,6 +101,7 @@ def debug() -> Callable[[FC], FC]:
     )
 
 
+@functools.cache
 def no_color() -> Callable[[FC], FC]:
     """Common no-color option for CLI commands."""
     return click.option(
@@ -141,6 +148,7 @@ def output(
     return functools.partial(functools.reduce, lambda x, opt: opt(x), options)
 
 
+@functools.cache
 def output_file() -> Callable[[FC], FC]:
     """Common output-file option for CLI commands."""
     return click.option(
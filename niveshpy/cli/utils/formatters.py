@@ -3,6 +3,7 @@
 import datetime
 import decimal
 import functools
+from collections.abc import Callable
 
 from niveshpy.models.account import AccountPublic
 from niveshpy.models.security import SecurityCategory, SecurityPublic, SecurityType
@@ -30,7 +31,16 @@ def format_decimal(
 format_percentage = functools.partial(format_decimal, is_percentage=True)
 
 
-def format_datetime(dt: datetime.datetime) -> str:
+_RELATIVE_TIME_UNITS = (
+    (60, 1, "seconds"),
+    (3600, 60, "minutes"),
+    (86400, 3600, "hours"),
+    (7 * 86400, 86400, "days"),
+)
+"""Relative time buckets as (upper limit, unit size, unit name), all in seconds."""
+
+
+def format_datetime(dt: datetime.datetime, now: datetime.datetime | None = None) -> str:
     """Format a datetime object to a relative time string.
 
     If the datetime is within 7 days, it shows relative time (e.g., "about 3 hours ago").
@@ -38,62 +48,70 @@ def format_datetime(dt: datetime.datetime) -> str:
 
     Args:
         dt (datetime.datetime): The datetime object to format.
+        now (datetime.datetime, optional): The reference time to measure against.
+            Pass a fixed value when formatting many datetimes so every row uses
+            the same reference and the clock is read only once. Defaults to the
+            current time.
 
     Returns:
         str: A human-readable relative time string.
 
     """
-    now = datetime.datetime.now()
+    if now is None:
+        now = datetime.datetime.now()
     delta = now - dt
     seconds = int(delta.total_seconds())
-    if seconds < 60:
-        return f"about {seconds} seconds ago"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        return f"about {minutes} minutes ago"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        return f"about {hours} hours ago"
-    else:
-        days = seconds // 86400
-        if days < 7:
-            return f"about {days} days ago"
-        else:
-            date = format_date(dt.date())
-            return f"on {date}"
+    for limit, unit_seconds, unit in _RELATIVE_TIME_UNITS:
+        if seconds < limit:
+            return f"about {seconds // unit_seconds} {unit} ago"
+    return f"on {format_date(dt.date())}"
+
+
+def relative_datetime_formatter() -> Callable[[datetime.datetime], str]:
+    """Create a relative datetime formatter with the current time captured once.
+
+    Returns:
+        Callable[[datetime.datetime], str]: ``format_datetime`` bound to a fixed
+            reference time, for formatting every row of one output the same way.
+    """
+    return functools.partial(format_datetime, now=datetime.datetime.now())
+
+
+DATE_FORMAT = "%d %b %Y"
+"""strftime pattern used to display dates in the CLI."""
 
 
 def format_date(d: datetime.date) -> str:
     """Format a date object to a string in the format 'DD MMM YYYY'."""
-    return d.strftime("%d %b %Y")
+    return d.strftime(DATE_FORMAT)
+
+
+_SECURITY_TYPE_FORMATS = {
+    SecurityType.STOCK.value: "[white]Stock",
+    SecurityType.BOND.value: "[cyan]Bond",
+    SecurityType.ETF.value: "[yellow]ETF",
+    SecurityType.MUTUAL_FUND.value: "[green]Mutual Fund",
+    SecurityType.OTHER.value: "[dim]Other",
+}
 
 
 def format_security_type(sec_type: SecurityType) -> str:
     """Format the security type for display in the CLI."""
-    from niveshpy.models.security import SecurityType
+    return _SECURITY_TYPE_FORMATS.get(sec_type, "[reverse]Unknown")
 
-    type_format_map = {
-        SecurityType.STOCK.value: "[white]Stock",
-        SecurityType.BOND.value: "[cyan]Bond",
-        SecurityType.ETF.value: "[yellow]ETF",
-        SecurityType.MUTUAL_FUND.value: "[green]Mutual Fund",
-        SecurityType.OTHER.value: "[dim]Other",
-    }
-    return type_format_map.get(sec_type, "[reverse]Unknown")
+
+_SECURITY_CATEGORY_FORMATS = {
+    SecurityCategory.EQUITY.value: "[white]Equity",
+    SecurityCategory.DEBT.value: "[cyan]Debt",
+    SecurityCategory.COMMODITY.value: "[yellow]Commodity",
+    SecurityCategory.REAL_ESTATE.value: "[bright_red]Real Estate",
+    SecurityCategory.OTHER.value: "[dim]Other",
+}
 
 
 def format_security_category(category: SecurityCategory) -> str:
     """Format the security category for display in the CLI."""
-    from niveshpy.models.security import SecurityCategory
-
-    category_format_map = {
-        SecurityCategory.EQUITY.value: "[white]Equity",
-        SecurityCategory.DEBT.value: "[cyan]Debt",
-        SecurityCategory.COMMODITY.value: "[yellow]Commodity",
-        SecurityCategory.REAL_ESTATE.value: "[bright_red]Real Estate",
-        SecurityCategory.OTHER.value: "[dim]Other",
-    }
-    return category_format_map.get(category, "[reverse]Unknown")
+    return _SECURITY_CATEGORY_FORMATS.get(category, "[reverse]Unknown")
 
 
 def format_security(security: SecurityPublic) -> str:
@@ -101,14 +119,16 @@ def format_security(security: SecurityPublic) -> str:
     return f"{security.name} ({security.key})"
 
 
+_TRANSACTION_TYPE_FORMATS = {
+    TransactionType.PURCHASE: "[green]Purchase",
+    TransactionType.SALE: "[red]Sale",
+    TransactionType.REVERSAL: "[yellow]Reversal",
+}
+
+
 def format_transaction_type(txn_type: TransactionType) -> str:
     """Format a transaction type for display in the CLI."""
-    type_format_map = {
-        TransactionType.PURCHASE: "[green]Purchase",
-        TransactionType.SALE: "[red]Sale",
-        TransactionType.REVERSAL: "[yellow]Reversal",
-    }
-    return type_format_map.get(txn_type, "[reverse]Unknown")
+    return _TRANSACTION_TYPE_FORMATS.get(txn_type, "[reverse]Unknown")
 
 
 def format_account(account: AccountPublic) -> str:
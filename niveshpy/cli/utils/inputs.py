@@ -1,14 +1,20 @@
 """Utility functions for handling user inputs."""
 
+import re
+from datetime import date
+
 # Validation utilities for the CLI.
 
+_DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
 
 def validate_date(date_str: str) -> bool:
     """Validate if the provided string is a valid date in YYYY-MM-DD format."""
-    from datetime import datetime
-
+    match = _DATE_PATTERN.fullmatch(date_str)
+    if match is None:
+        return False
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        date(*map(int, match.groups()))
         return True
     except ValueError:
         return False
@@ -26,6 +32,6 @@ def ask_password(prompt: str = "Enter password: ") -> str:
     Returns:
         str: The password entered by the user.
     """
-    from niveshpy.cli.utils.setup import _console
+    from niveshpy.cli.utils.setup import get_console
 
-    return _console.input(prompt, password=True).strip()
+    return get_console().input(prompt, password=True).strip()
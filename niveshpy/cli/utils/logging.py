@@ -1,6 +1,8 @@
 """Set up logging for Niveshpy CLI."""
 
 from logging import DEBUG, INFO, WARNING, Filter, Formatter
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from pathlib import Path
 
 from rich.console import Console
 
@@ -12,28 +14,54 @@ class TracebackInfoFilter(Filter):
 
     def filter(self, record):
         """Filter out exception info from log records."""
+        if record.exc_info is None and record.exc_text is None:
+            return True  # Nothing to hide; skip the attribute writes
         record._exc_info_hidden, record.exc_info = record.exc_info, None
         record.exc_text = None
         return True
 
 
+class DeferredRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that touches the filesystem only on first write.
+
+    Neither the log directory nor the log file is created until a record is
+    actually emitted, so commands that never log to file do no file I/O.
+    """
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int) -> None:
+        """Initialize the handler without opening the log file."""
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
+
+    def _open(self):
+        """Create the log directory if needed and open the log file."""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 def setup(debug: bool, console: Console) -> None:
     """Set up logging configuration for CLI."""
-    from logging.handlers import RotatingFileHandler
-
     import platformdirs
     from rich.logging import RichHandler
 
-    log_path = (
-        platformdirs.user_log_path("niveshpy", ensure_exists=True) / "niveshpy.log"
-    ).resolve()
-    file_handler = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3)
+    log_path = platformdirs.user_log_path("niveshpy") / "niveshpy.log"
+    file_handler = DeferredRotatingFileHandler(
+        log_path, max_bytes=1_000_000, backup_count=3
+    )
 
     FORMAT = "%(asctime)s :: %(name)-12s :: %(levelname)-8s :: %(message)s"
 
     file_handler.setFormatter(Formatter(fmt=FORMAT))
     file_handler.setLevel(DEBUG if debug else INFO)
 
+    # Batch records into fewer file writes; warnings and above flush immediately
+    # and any remaining records are flushed when logging shuts down.
+    buffered_file_handler = MemoryHandler(
+        capacity=1024, flushLevel=WARNING, target=file_handler
+    )
+    buffered_file_handler.setLevel(DEBUG if debug else INFO)
+
     console_handler = RichHandler(
         level=INFO if debug else WARNING,
         console=console,
@@ -45,7 +73,7 @@ def setup(debug: bool, console: Console) -> None:
     if not debug:
         console_handler.addFilter(TracebackInfoFilter())
 
-    logging.setup(file_handler, console_handler)
+    logging.setup(buffered_file_handler, console_handler)
 
     if debug:
         logging.logger.info("Logging to file: %s", log_path.as_posix())
@@ -7,29 +7,29 @@ from collections.abc import (
 )
 from typing import TYPE_CHECKING
 
-from rich.console import Console
-
 from niveshpy.cli.utils.display import display, display_error, display_warning
-from niveshpy.cli.utils.setup import _error_console
+from niveshpy.cli.utils.setup import get_error_console
 from niveshpy.core.logging import logger
 from niveshpy.exceptions import NiveshPyError
 from niveshpy.models.output import BaseMessage, Message, ProgressUpdate, Warning
 
 if TYPE_CHECKING:
     from rich import progress
+    from rich.console import Console
 
 
 def get_progress_bar() -> progress.Progress:
     """Create and return a Rich Progress bar instance for displaying progress."""
     from rich import progress
 
+    error_console = get_error_console()
     return progress.Progress(
         progress.TextColumn("[progress.description]{task.description}"),
         progress.SpinnerColumn(),
         progress.MofNCompleteColumn(),
         progress.TimeElapsedColumn(),
-        console=_error_console,
-        disable=not _error_console.is_terminal,
+        console=error_console,
+        disable=not error_console.is_terminal,
     )
 
 
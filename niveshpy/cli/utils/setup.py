@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
-from rich.console import Console
-
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from niveshpy.core.app import AppState
 
-_console = Console()  # Global console instance for utility functions
-_error_console = Console(stderr=True)  # Console for error messages
+
+@functools.cache
+def get_console() -> Console:
+    """Get the global console instance for utility functions.
+
+    The console is created on first use so that importing CLI modules does not
+    pay for Rich's terminal detection.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def get_error_console() -> Console:
+    """Get the global console instance for error messages."""
+    from rich.console import Console
+
+    return Console(stderr=True)
 
 
 def initialize_app_state(state: AppState) -> None:
@@ -24,12 +42,15 @@ def initialize_app_state(state: AppState) -> None:
     """
     from niveshpy.cli.utils import logging
 
+    console = get_console()
+    error_console = get_error_console()
+
     if not state.no_input:
         # If no_input is not set, determine interactivity from console
-        state.no_input = not _console.is_interactive
+        state.no_input = not console.is_interactive
 
     if state.no_color:
-        _console.no_color = True
-        _error_console.no_color = True
+        console.no_color = True
+        error_console.no_color = True
 
-    logging.setup(state.debug, _error_console)  # Initialize logging with debug flag
+    logging.setup(state.debug, error_console)  # Initialize logging with debug flag
@@ -0,0 +1,15 @@
+"""Shared access to installed plugin entry points."""
+
+import functools
+import importlib.metadata
+
+
+@functools.cache
+def get_entry_points(group: str) -> importlib.metadata.EntryPoints:
+    """Return the installed entry points in a group.
+
+    Package metadata is read from disk only once per group and process, so
+    repeated discovery (e.g. validating and then initializing a provider)
+    reuses the first lookup.
+    """
+    return importlib.metadata.entry_points(group=group)
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 from attrs import define
 
 from niveshpy.core.logging import logger
-from niveshpy.domain.services import get_transaction_validation_service
 
 if TYPE_CHECKING:
     from niveshpy.domain.repositories import (
@@ -110,6 +109,7 @@ class Application:
         strict: bool = False,
     ) -> ParsingService:
         """Get the parsing service for the given parser key."""
+        from niveshpy.domain.services import get_transaction_validation_service
         from niveshpy.services.parsing_service import ParsingService
 
         return ParsingService(
@@ -4,9 +4,11 @@ Logging Strategy
 ================
 
 NiveshPy uses a central ``niveshpy`` logger with two handlers configured in
-``cli/utils/logging.py``: a RotatingFileHandler (1 MB, 3 backups) and a
-RichHandler for console output.  The ``--debug`` flag toggles between normal
-mode (file=INFO, console=WARNING) and debug mode (file=DEBUG, console=INFO).
+``cli/utils/logging.py``: a RotatingFileHandler (1 MB, 3 backups) buffered
+through a MemoryHandler, and a RichHandler for console output.  The buffer is
+flushed on WARNING or above and when logging shuts down.  The ``--debug`` flag
+toggles between normal mode (file=INFO, console=WARNING) and debug mode
+(file=DEBUG, console=INFO).
 
 Level Guidelines:
     CRITICAL: Application cannot start — database corruption, missing critical
@@ -36,8 +38,6 @@ Principles:
 """
 
 import logging
-import logging.config
-import logging.handlers
 
 logger = logging.getLogger("niveshpy")
 warnings_logger = logging.getLogger("py.warnings")
@@ -1,20 +1,25 @@
 """Module for parser registration and management."""
 
+import bisect
 import functools
 
 from niveshpy.core.logging import logger
 from niveshpy.models.parser import ParserFactory
 
 _REGISTERED_PARSERS: dict[str, type[ParserFactory]] = {}
+_SORTED_PARSER_KEYS: list[str] = []
 
 
 def register_parser(name: str, parser_factory: type[ParserFactory]) -> None:
     """Register a new parser."""
     parser_info = parser_factory.get_parser_info()
     if name in _REGISTERED_PARSERS:
-        logger.warning(f"Parser with key '{name}' is already registered. Overwriting.")
+        logger.warning("Parser with key '%s' is already registered. Overwriting.", name)
+    else:
+        bisect.insort(_SORTED_PARSER_KEYS, name)
     _REGISTERED_PARSERS[name] = parser_factory
-    logger.info(f"Registered parser: {parser_info.name} ({name})")
+    list_parsers_starting_with.cache_clear()
+    logger.info("Registered parser: %s (%s)", parser_info.name, name)
 
 
 def is_empty() -> bool:
@@ -29,15 +34,17 @@ def get_parser(key: str) -> type[ParserFactory] | None:
 
 @functools.cache
 def list_parsers_starting_with(prefix: str) -> list[tuple[str, type[ParserFactory]]]:
-    """Retrieve registered parsers whose keys start with the given prefix."""
-    return [
-        (key, parser_factory)
-        for key, parser_factory in _REGISTERED_PARSERS.items()
-        if key.startswith(prefix)
-    ]
+    """Retrieve registered parsers whose keys start with a prefix, in key order."""
+    keys = _SORTED_PARSER_KEYS
+    if not prefix:  # Completing an empty word lists every parser
+        return [(key, _REGISTERED_PARSERS[key]) for key in keys]
+    # Keys sharing the prefix form a contiguous run in sorted order.
+    start = end = bisect.bisect_left(keys, prefix)
+    while end < len(keys) and keys[end].startswith(prefix):
+        end += 1
+    return [(key, _REGISTERED_PARSERS[key]) for key in keys[start:end]]
 
 
-@functools.cache
 def list_parsers() -> list[type[ParserFactory]]:
     """List all registered parsers."""
     return list(_REGISTERED_PARSERS.values())
@@ -45,12 +52,13 @@ def list_parsers() -> list[type[ParserFactory]]:
 
 def discover_installed_parsers(name: str | None = None) -> None:
     """Discover and register all installed parsers."""
-    import importlib.metadata
+    from niveshpy.core._entrypoints import get_entry_points
 
     _REGISTERED_PARSERS.clear()
+    _SORTED_PARSER_KEYS.clear()
+    list_parsers_starting_with.cache_clear()
 
-    entry_points = importlib.metadata.entry_points()
-    parser_entry_points = entry_points.select(group="niveshpy.parsers")
+    parser_entry_points = get_entry_points("niveshpy.parsers")
 
     if name:
         parser_entry_points = parser_entry_points.select(name=name)
@@ -58,5 +66,3 @@ def discover_installed_parsers(name: str | None = None) -> None:
     for entry_point in parser_entry_points:
         parser_factory = entry_point.load()
         register_parser(entry_point.name, parser_factory)
-    list_parsers.cache_clear()
-    list_parsers_starting_with.cache_clear()
@@ -1,11 +1,13 @@
 """Module for provider registration and management."""
 
+import bisect
 import functools
 
 from niveshpy.core.logging import logger
 from niveshpy.models.provider import ProviderFactory
 
 _REGISTERED_PROVIDERS: dict[str, type[ProviderFactory]] = {}
+_SORTED_PROVIDER_KEYS: list[str] = []
 
 
 def register_provider(name: str, provider_factory: type[ProviderFactory]) -> None:
@@ -13,10 +15,13 @@ def register_provider(name: str, provider_factory: type[ProviderFactory]) -> Non
     provider_info = provider_factory.get_provider_info()
     if name in _REGISTERED_PROVIDERS:
         logger.warning(
-            f"Provider with key '{name}' is already registered. Overwriting."
+            "Provider with key '%s' is already registered. Overwriting.", name
         )
+    else:
+        bisect.insort(_SORTED_PROVIDER_KEYS, name)
     _REGISTERED_PROVIDERS[name] = provider_factory
-    logger.info(f"Registered provider: {provider_info.name} ({name})")
+    list_providers_starting_with.cache_clear()
+    logger.info("Registered provider: %s (%s)", provider_info.name, name)
 
 
 def is_empty() -> bool:
@@ -33,15 +38,17 @@ def get_provider(key: str) -> type[ProviderFactory] | None:
 def list_providers_starting_with(
     prefix: str,
 ) -> list[tuple[str, type[ProviderFactory]]]:
-    """Retrieve registered providers whose keys start with the given prefix."""
-    return [
-        (key, provider_factory)
-        for key, provider_factory in _REGISTERED_PROVIDERS.items()
-        if key.startswith(prefix)
-    ]
+    """Retrieve registered providers whose keys start with a prefix, in key order."""
+    keys = _SORTED_PROVIDER_KEYS
+    if not prefix:  # Completing an empty word lists every provider
+        return [(key, _REGISTERED_PROVIDERS[key]) for key in keys]
+    # Keys sharing the prefix form a contiguous run in sorted order.
+    start = end = bisect.bisect_left(keys, prefix)
+    while end < len(keys) and keys[end].startswith(prefix):
+        end += 1
+    return [(key, _REGISTERED_PROVIDERS[key]) for key in keys[start:end]]
 
 
-@functools.cache
 def list_providers() -> list[tuple[str, type[ProviderFactory]]]:
     """List all registered providers."""
     return list(_REGISTERED_PROVIDERS.items())
@@ -49,12 +56,13 @@ def list_providers() -> list[tuple[str, type[ProviderFactory]]]:
 
 def discover_installed_providers(name: str | None = None) -> None:
     """Discover and register all installed providers."""
-    import importlib.metadata
+    from niveshpy.core._entrypoints import get_entry_points
 
     _REGISTERED_PROVIDERS.clear()
+    _SORTED_PROVIDER_KEYS.clear()
+    list_providers_starting_with.cache_clear()
 
-    entry_points = importlib.metadata.entry_points()
-    provider_entry_points = entry_points.select(group="niveshpy.providers.price")
+    provider_entry_points = get_entry_points("niveshpy.providers.price")
 
     if name:
         provider_entry_points = provider_entry_points.select(name=name)
@@ -62,6 +70,3 @@ def discover_installed_providers(name: str | None = None) -> None:
     for entry_point in provider_entry_points:
         provider_factory = entry_point.load()
         register_provider(entry_point.name, provider_factory)
-
-    list_providers.cache_clear()
-    list_providers_starting_with.cache_clear()
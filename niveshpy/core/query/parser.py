@@ -1,15 +1,31 @@
 """Module for parsing user queries into structured filters."""
 
 import decimal
-import itertools
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from datetime import date, timedelta
+from typing import Any
 
 from niveshpy.core.query import tokens as Tokens
 from niveshpy.core.query.tokenizer import QueryLexer
 from niveshpy.domain.query import ast
 from niveshpy.exceptions import OperationError, QuerySyntaxError
 
+# Token classes are never subclassed, so conversion can dispatch on the exact type.
+_TOKEN_TO_STRING: dict[type[Tokens.Token], Callable[[Any], str]] = {
+    Tokens.Colon: lambda _: ":",
+    Tokens.Dash: lambda _: "-",
+    Tokens.Dot: lambda _: ".",
+    Tokens.RangeSeparator: lambda _: "..",
+    Tokens.Gt: lambda _: ">",
+    Tokens.GtEq: lambda _: ">=",
+    Tokens.Lt: lambda _: "<",
+    Tokens.LtEq: lambda _: "<=",
+    Tokens.Keyword: lambda tok: tok.value,
+    Tokens.Literal: lambda tok: tok.value,
+    Tokens.Int: lambda tok: tok.value,
+    Tokens.Unknown: lambda tok: tok.char,
+}
+
 
 class QueryParser:
     """Class to parse a user query into structured filters."""
@@ -23,35 +39,13 @@ class QueryParser:
         """Convert a sequence of tokens to a string."""
         strings = []
         for tok in tokens:
-            match tok:
-                case Tokens.Colon():
-                    strings.append(":")
-                case Tokens.Dash():
-                    strings.append("-")
-                case Tokens.Dot():
-                    strings.append(".")
-                case Tokens.RangeSeparator():
-                    strings.append("..")
-                case Tokens.Gt():
-                    strings.append(">")
-                case Tokens.GtEq():
-                    strings.append(">=")
-                case Tokens.Lt():
-                    strings.append("<")
-                case Tokens.LtEq():
-                    strings.append("<=")
-                case Tokens.Keyword(value=kw_value):
-                    strings.append(kw_value)
-                case Tokens.Literal(value=lit_value):
-                    strings.append(lit_value)
-                case Tokens.Int(value=int_value):
-                    strings.append(str(int_value))
-                case Tokens.Unknown(char=char):
-                    strings.append(char)
-                case _:
-                    raise OperationError(
-                        f"Unexpected token {tok} in sequence {tokens} for string conversion."
-                    )
+            try:
+                to_string = _TOKEN_TO_STRING[type(tok)]
+            except KeyError:
+                raise OperationError(
+                    f"Unexpected token {tok} in sequence {tokens} for string conversion."
+                ) from None
+            strings.append(to_string(tok))
         return "".join(strings)
 
     @staticmethod
@@ -132,29 +126,31 @@ class QueryParser:
 
     def read_remaining_as_literal(self) -> str:
         """Read the entire input as a literal string."""
-        return QueryParser.convert_to_string(self.get_remaining_tokens())
+        return self.lexer.read_remaining()
 
-    def get_remaining_tokens(self) -> list[Tokens.Token]:
-        """Get all remaining tokens from the lexer."""
-        return list(
-            itertools.takewhile(
-                lambda t: not isinstance(t, Tokens.End), iter(self.lexer)
-            )
-        )
+    def get_remaining_tokens_with_separator(self) -> tuple[list[Tokens.Token], int]:
+        """Get all remaining tokens and the index of the first range separator.
+
+        The index is -1 if there is no range separator.
+        """
+        tokens: list[Tokens.Token] = []
+        sep_index = -1
+        while not isinstance(token := self.lexer.next_token(), Tokens.End):
+            if sep_index < 0 and isinstance(token, Tokens.RangeSeparator):
+                sep_index = len(tokens)
+            tokens.append(token)
+        return tokens, sep_index
 
     def negate_filters(self, filters: Sequence[ast.FilterNode]) -> list[ast.FilterNode]:
         """Negate the given filters."""
-        negated_filters = []
-        for filter_node in filters:
-            negated_operator = filter_node.operator.negate()
-            negated_filters.append(
-                ast.FilterNode(
-                    field=filter_node.field,
-                    operator=negated_operator,
-                    value=filter_node.value,
-                )
+        return [
+            ast.FilterNode(
+                field=filter_node.field,
+                operator=filter_node.operator.negate(),
+                value=filter_node.value,
             )
-        return negated_filters
+            for filter_node in filters
+        ]
 
     def get_operator_from_token(self, token: Tokens.Token) -> ast.Operator:
         """Map a token to its corresponding AST operator."""
@@ -189,7 +185,7 @@ class QueryParser:
 
             case Tokens.Keyword.Amount:
                 field = ast.Field.AMOUNT
-                tokens = self.get_remaining_tokens()
+                tokens, sep_index = self.get_remaining_tokens_with_separator()
                 match tokens:
                     case [
                         (
@@ -200,27 +196,26 @@ class QueryParser:
                         operator = self.get_operator_from_token(op)
                         value = self.convert_to_number(value_tokens)
 
-                    case _ if Tokens.RangeSeparator() in tokens:  # Range expression
-                        sep_index = tokens.index(Tokens.RangeSeparator())
-                        if len(tokens) == 1:  # Only '..' is present
-                            raise QuerySyntaxError(
-                                str(tokens),
-                                "Both start and end amount cannot be empty in a range expression.",
-                            )
+                    case _ if sep_index >= 0:  # Range expression
                         start_value = (
                             self.convert_to_number(tokens[:sep_index])
                             if sep_index > 0
-                            else decimal.Decimal(decimal.MIN_EMIN)
+                            else None
                         )
                         end_value = (
                             self.convert_to_number(tokens[sep_index + 1 :])
                             if sep_index < len(tokens) - 1
-                            else decimal.Decimal(decimal.MAX_EMAX)
+                            else None
                         )
-                        if start_value == decimal.Decimal(decimal.MIN_EMIN):
+                        if start_value is None:
+                            if end_value is None:  # Only '..' is present
+                                raise QuerySyntaxError(
+                                    str(tokens),
+                                    "Both start and end amount cannot be empty in a range expression.",
+                                )
                             operator = ast.Operator.LESS_THAN_EQ
                             value = end_value
-                        elif end_value == decimal.Decimal(decimal.MAX_EMAX):
+                        elif end_value is None:
                             operator = ast.Operator.GREATER_THAN_EQ
                             value = start_value
                         elif start_value > end_value:
@@ -240,33 +235,33 @@ class QueryParser:
 
             case Tokens.Keyword.Date:
                 field = ast.Field.DATE
-                tokens = self.get_remaining_tokens()
-                if Tokens.RangeSeparator() in tokens:  # Range expression
-                    sep_index = tokens.index(Tokens.RangeSeparator())
-                    if len(tokens) == 1:  # Only '..' is present
-                        raise QuerySyntaxError(
-                            str(tokens),
-                            "Both start date and end date cannot be empty in a range expression.",
-                        )
-
+                tokens, sep_index = self.get_remaining_tokens_with_separator()
+                start_date: date | None
+                end_date: date | None
+                if sep_index >= 0:  # Range expression
                     start_date = (
                         self.convert_to_date(tokens[:sep_index], start=True)
                         if sep_index > 0
-                        else date.min
+                        else None
                     )
                     end_date = (
                         self.convert_to_date(tokens[sep_index + 1 :], start=False)
                         if sep_index < len(tokens) - 1
-                        else date.max
+                        else None
                     )
                 else:  # Single date
                     start_date = self.convert_to_date(tokens, start=True)
                     end_date = self.convert_to_date(tokens, start=False)
 
-                if start_date == date.min:
+                if start_date is None:
+                    if end_date is None:  # Only '..' is present
+                        raise QuerySyntaxError(
+                            str(tokens),
+                            "Both start date and end date cannot be empty in a range expression.",
+                        )
                     operator = ast.Operator.LESS_THAN_EQ
                     value = end_date
-                elif end_date == date.max:
+                elif end_date is None:
                     operator = ast.Operator.GREATER_THAN_EQ
                     value = start_date
                 elif start_date > end_date:
@@ -302,8 +297,9 @@ class QueryParser:
             case _:
                 field = ast.Field.DEFAULT
                 operator = ast.Operator.REGEX_MATCH
-                value = self.convert_to_string(
-                    [first_token] + self.get_remaining_tokens()
+                value = (
+                    self.convert_to_string([first_token])
+                    + self.read_remaining_as_literal()
                 )
 
         return [
@@ -1,5 +1,6 @@
 """Module for preparing query AST nodes for evaluation."""
 
+import functools
 import itertools
 from collections import defaultdict
 from collections.abc import Container, Iterable
@@ -43,7 +44,8 @@ def combine_filters(field: Field, filters: Iterable[FilterNode]) -> list[FilterN
     """Combine multiple filters of comparable operator into a single filter.
 
     This function combines filters that can be logically merged, such as multiple
-    equality checks into an IN operator.
+    equality checks into an IN operator. A filter with nothing to merge with is
+    returned unchanged.
 
     Args:
         field (Field): The field of the filters to combine.
@@ -52,24 +54,31 @@ def combine_filters(field: Field, filters: Iterable[FilterNode]) -> list[FilterN
     Returns:
         list: The combined list of FilterNode objects.
     """
-    combined_filters: dict[Operator, list[FilterNode]] = defaultdict(list)
-    other_filters: list[FilterNode] = []
+    combined_values: dict[Operator, list[FilterValue]] = defaultdict(list)
+    # The filter behind each combined operator, or None once several share it.
+    sole_filters: dict[Operator, FilterNode | None] = {}
+    results: list[FilterNode] = []
 
     for filter_node in filters:
-        if filter_node.operator in COMBINED:
-            combined_filters[COMBINED[filter_node.operator]].append(filter_node)
-        else:
-            other_filters.append(filter_node)
-
-    results = other_filters.copy()
+        combined_operator = COMBINED.get(filter_node.operator)
+        if combined_operator is None:
+            results.append(filter_node)
+            continue
 
-    for operator, ops_filters in combined_filters.items():
-        values: list[FilterValue] = []
-        for f in ops_filters:
-            if isinstance(f.value, tuple):
-                values.extend(f.value)
-            else:
-                values.append(f.value)
+        sole_filters[combined_operator] = (
+            None if combined_operator in sole_filters else filter_node
+        )
+        if isinstance(filter_node.value, tuple):
+            combined_values[combined_operator].extend(filter_node.value)
+        else:
+            combined_values[combined_operator].append(filter_node.value)
+
+    for operator, values in combined_values.items():
+        sole_filter = sole_filters[operator]
+        if sole_filter is not None:
+            # Nothing to merge; keep the original node (e.g. EQUALS rather than IN).
+            results.append(sole_filter)
+            continue
         results.append(
             FilterNode(
                 field=field,
@@ -103,6 +112,23 @@ COMBINED = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def parse_query(query: str) -> tuple[FilterNode, ...]:
+    """Parse a single stripped query string into filter nodes.
+
+    Results are cached by query text, so the same query parsed again (e.g. for
+    both its filters and its fields) is not lexed twice. Filter nodes are
+    immutable, so cached results are safe to share.
+
+    Args:
+        query (str): The query string, with surrounding whitespace removed.
+
+    Returns:
+        tuple: The parsed FilterNode objects.
+    """
+    return tuple(QueryParser(QueryLexer(query)).parse())
+
+
 def get_prepared_filters_from_queries(
     queries: tuple[str, ...],
     default_field: Field,
@@ -110,11 +136,8 @@ def get_prepared_filters_from_queries(
 ) -> list[FilterNode]:
     """Parse query strings into prepared filter nodes."""
     try:
-        stripped_queries = map(str.strip, queries)
-        lexers = map(QueryLexer, stripped_queries)
-        parsers = map(QueryParser, lexers)
         filters: Iterable[FilterNode] = itertools.chain.from_iterable(
-            map(QueryParser.parse, parsers)
+            map(parse_query, map(str.strip, queries))
         )
         filters = prepare_filters(filters, default_field)
         logger.debug(
@@ -141,11 +164,8 @@ def get_fields_from_queries(queries: tuple[str, ...]) -> set[Field]:
         set: The set of Fields used in the queries.
     """
     try:
-        stripped_queries = map(str.strip, queries)
-        lexers = map(QueryLexer, stripped_queries)
-        parsers = map(QueryParser, lexers)
         filters: list[FilterNode] = list(
-            itertools.chain.from_iterable(map(QueryParser.parse, parsers))
+            itertools.chain.from_iterable(map(parse_query, map(str.strip, queries)))
         )
     except QuerySyntaxError as e:
         e.add_note(f"Error was reported on input: {e.input_value}")
@@ -2,6 +2,19 @@
 
 from niveshpy.core.query import tokens
 
+# Tokens without fields are interchangeable, so the lexer reuses one instance of each.
+_END = tokens.End()
+_COLON = tokens.Colon()
+_DASH = tokens.Dash()
+_DOT = tokens.Dot()
+_RANGE_SEPARATOR = tokens.RangeSeparator()
+_GT = tokens.Gt()
+_GT_EQ = tokens.GtEq()
+_LT = tokens.Lt()
+_LT_EQ = tokens.LtEq()
+
+_KEYWORDS = {keyword.value: keyword for keyword in tokens.Keyword}
+
 
 class QueryLexer:
     """Class to tokenize and parse user queries."""
@@ -32,16 +45,31 @@ class QueryLexer:
     def read_literal(self) -> str:
         """Read a literal until a special character is encountered."""
         start_position = self.position
-        while (nxt := self.peek()) and nxt != "" and nxt != ":":
-            self.read_char()
-        return self.text[start_position : self.read_position]
+        end_position = self.text.find(":", self.read_position)
+        if end_position == -1:
+            end_position = len(self.text)
+        # Let str.find scan for the delimiter, then move onto the last character.
+        self.read_position = end_position - 1
+        self.read_char()
+        return self.text[start_position:end_position]
 
     def read_int(self) -> str:
         """Read an integer from the input."""
+        text = self.text
         start_position = self.position
-        while self.peek().isdigit():
-            self.read_char()
-        return self.text[start_position : self.read_position]
+        end_position = self.read_position
+        while end_position < len(text) and text[end_position].isdigit():
+            end_position += 1
+        self.read_position = end_position - 1
+        self.read_char()
+        return text[start_position:end_position]
+
+    def read_remaining(self) -> str:
+        """Consume the rest of the input and return it verbatim."""
+        remaining = self.text[self.position :]
+        self.read_position = len(self.text)
+        self.read_char()
+        return remaining
 
     def __iter__(self):
         """Return the iterator object."""
@@ -54,58 +82,40 @@ class QueryLexer:
         tok: tokens.Token
         match self.chr:
             case "":
-                tok = tokens.End()
+                tok = _END
             case ":":
-                tok = tokens.Colon()
+                tok = _COLON
             case "-":
-                tok = tokens.Dash()
+                tok = _DASH
             case ".":
                 if self.peek() == ".":
                     self.read_char()
-                    tok = tokens.RangeSeparator()
+                    tok = _RANGE_SEPARATOR
                 else:
-                    tok = tokens.Dot()
+                    tok = _DOT
             case ">":
                 if self.peek() == "=":
                     self.read_char()
-                    tok = tokens.GtEq()
+                    tok = _GT_EQ
                 else:
-                    tok = tokens.Gt()
+                    tok = _GT
             case "<":
                 if self.peek() == "=":
                     self.read_char()
-                    tok = tokens.LtEq()
+                    tok = _LT_EQ
                 else:
-                    tok = tokens.Lt()
+                    tok = _LT
             case t if t.isdigit():
                 integer = self.read_int()
                 tok = tokens.Int(value=integer)
             case t if t.isalpha():
                 word = self.read_literal()
-                match word:
-                    case "date" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Date
-                    case "amt" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Amount
-                    case "desc" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Description
-                    case "type" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Type
-                    case "acct" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Account
-                    case "sec" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Security
-                    case "not" if self.peek() == ":":
-                        self.read_char()
-                        tok = tokens.Keyword.Not
-                    case _:
-                        tok = tokens.Literal(value=word)
+                keyword = _KEYWORDS.get(word)
+                if keyword is not None and self.peek() == ":":
+                    self.read_char()
+                    tok = keyword
+                else:
+                    tok = tokens.Literal(value=word)
             case _:
                 tok = tokens.Literal(value=self.read_literal())
 
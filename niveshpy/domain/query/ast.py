@@ -36,20 +36,23 @@ class Operator(Enum):
 
     def negate(self) -> "Operator":
         """Return the negated version of the operator."""
-        return {
-            Operator.EQUALS: Operator.NOT_EQUALS,
-            Operator.NOT_EQUALS: Operator.EQUALS,
-            Operator.GREATER_THAN: Operator.LESS_THAN_EQ,
-            Operator.GREATER_THAN_EQ: Operator.LESS_THAN,
-            Operator.LESS_THAN: Operator.GREATER_THAN_EQ,
-            Operator.LESS_THAN_EQ: Operator.GREATER_THAN,
-            Operator.BETWEEN: Operator.NOT_BETWEEN,
-            Operator.NOT_BETWEEN: Operator.BETWEEN,
-            Operator.IN: Operator.NOT_IN,
-            Operator.NOT_IN: Operator.IN,
-            Operator.REGEX_MATCH: Operator.NOT_REGEX_MATCH,
-            Operator.NOT_REGEX_MATCH: Operator.REGEX_MATCH,
-        }.get(self, self)
+        return _NEGATIONS.get(self, self)
+
+
+_NEGATIONS: dict[Operator, Operator] = {
+    Operator.EQUALS: Operator.NOT_EQUALS,
+    Operator.NOT_EQUALS: Operator.EQUALS,
+    Operator.GREATER_THAN: Operator.LESS_THAN_EQ,
+    Operator.GREATER_THAN_EQ: Operator.LESS_THAN,
+    Operator.LESS_THAN: Operator.GREATER_THAN_EQ,
+    Operator.LESS_THAN_EQ: Operator.GREATER_THAN,
+    Operator.BETWEEN: Operator.NOT_BETWEEN,
+    Operator.NOT_BETWEEN: Operator.BETWEEN,
+    Operator.IN: Operator.NOT_IN,
+    Operator.NOT_IN: Operator.IN,
+    Operator.REGEX_MATCH: Operator.NOT_REGEX_MATCH,
+    Operator.NOT_REGEX_MATCH: Operator.REGEX_MATCH,
+}
 
 
 FilterValue = (
@@ -96,7 +96,7 @@ class SqliteTransactionRepository:
         result = self.database.select_one(query, cl=TransactionPublic)
 
         if result is None:
-            logger.debug(f"No transaction found with ID {transaction_id}.")
+            logger.debug("No transaction found with ID %s.", transaction_id)
             return None
 
         if fetch_profile == TransactionFetchProfile.WITH_RELATIONS:
@@ -105,7 +105,7 @@ class SqliteTransactionRepository:
             security = self.security_repository.get_security_by_key(result.security_key)
             result = evolve(result, account=account, security=security)
 
-        logger.debug(f"Fetched transaction with ID {transaction_id}: {result}")
+        logger.debug("Fetched transaction with ID %s: %s", transaction_id, result)
         return result
 
     def _update_transactions_with_relations(
@@ -309,7 +309,7 @@ class SqliteTransactionRepository:
         if fetch_profile == TransactionFetchProfile.WITH_RELATIONS:
             transactions = self._update_transactions_with_relations(transactions)
 
-        logger.debug(f"Found {len(transactions)} transactions matching IDs")
+        logger.debug("Found %d transactions matching IDs", len(transactions))
         return transactions
 
     def insert_transaction(self, transaction: TransactionCreate) -> int:
@@ -333,7 +333,7 @@ class SqliteTransactionRepository:
                 cursor.execute(str(stmt), stmt.params)
                 transaction_id = cursor.lastrowid
                 cursor.connection.commit()
-                logger.debug(f"Inserted transaction with ID {transaction_id}")
+                logger.debug("Inserted transaction with ID %s", transaction_id)
                 if transaction_id is None:
                     # This should never happen since the ID is auto-generated by the database, but we check just in case to avoid returning None as an int
                     raise DatabaseError(
@@ -341,7 +341,7 @@ class SqliteTransactionRepository:
                     )
                 return transaction_id
         except IntegrityError as e:
-            logger.info(f"Failed to insert transaction due to integrity error: {e}")
+            logger.info("Failed to insert transaction due to integrity error: %s", e)
             if "FOREIGN KEY constraint failed" in str(e):
                 raise DatabaseError(
                     "Failed to insert transaction due to foreign key constraint. "
@@ -379,7 +379,7 @@ class SqliteTransactionRepository:
         try:
             result = self.database.executemany(stmt, transaction_tuples)
         except IntegrityError as e:
-            logger.info(f"Failed to insert transactions due to integrity error: {e}")
+            logger.info("Failed to insert transactions due to integrity error: %s", e)
             if "FOREIGN KEY constraint failed" in str(e):
                 raise DatabaseError(
                     "Failed to insert transactions due to foreign key constraint. "
@@ -390,7 +390,7 @@ class SqliteTransactionRepository:
                     "Failed to insert transactions due to database integrity error."
                 ) from e
 
-        logger.debug(f"Inserted {result} transactions in bulk.")
+        logger.debug("Inserted %s transactions in bulk.", result)
         return result
 
     def delete_transaction_by_id(self, transaction_id: int) -> bool:
@@ -409,9 +409,9 @@ class SqliteTransactionRepository:
         )
         result = self.database.execute(stmt)
         if result == 0:
-            logger.debug(f"No transaction found with ID {transaction_id} to delete.")
+            logger.debug("No transaction found with ID %s to delete.", transaction_id)
             return False
-        logger.debug(f"Deleted transaction with ID {transaction_id}.")
+        logger.debug("Deleted transaction with ID %s.", transaction_id)
         return True
 
     def overwrite_transactions_in_date_range_for_accounts(
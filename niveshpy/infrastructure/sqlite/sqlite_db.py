@@ -20,15 +20,39 @@ from niveshpy.infrastructure.sqlite.converters import get_converter
 from niveshpy.infrastructure.sqlite.query import Delete, Insert, Query
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_iregexp(pattern: str) -> re.Pattern[str]:
+    """Compile a case-insensitive pattern once per distinct pattern string."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def _iregexp(pattern: str, value: str | None) -> bool:
     """Case-insensitive regex match for SQLite."""
     if value is None:
         return False
-    return bool(re.search(pattern, value, re.IGNORECASE))
+    return _compile_iregexp(pattern).search(value) is not None
+
+
+def _optimize_and_close(conn: sqlite3.Connection) -> None:
+    """Refresh query planner statistics and close the connection."""
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error as e:
+        logger.debug("Skipping PRAGMA optimize: %s", e)
+    conn.close()
 
 
 T = TypeVar("T")
 
+# Connection-level tuning applied once when the connection is opened.
+_PRAGMAS = (
+    "PRAGMA synchronous=FULL",  # Committed ledger writes must survive power loss
+    "PRAGMA cache_size=-16384",  # 16 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
 
 @frozen
 class SqliteDatabase:
@@ -45,14 +69,19 @@ class SqliteDatabase:
         """Get a new SQLite database connection."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level="IMMEDIATE"
+            )
             logger.debug("SQLite connection established to %s", self.db_path)
             if self._debug:
                 conn.set_trace_callback(logger.debug)
-            conn.create_function("iregexp", 2, _iregexp)
-            conn.execute("PRAGMA foreign_keys=ON")
+            conn.create_function("iregexp", 2, _iregexp, deterministic=True)
+            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            logger.debug("SQLite journal mode: %s", journal_mode)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
             conn.row_factory = sqlite3.Row
-            atexit.register(conn.close)
+            atexit.register(_optimize_and_close, conn)
             return conn
         except sqlite3.Error as e:
             raise DatabaseError("Error connecting to the SQLite database") from e
@@ -80,7 +109,6 @@ class SqliteDatabase:
 
     def _run_migrations(self) -> None:
         """Run database migrations to ensure the schema is up to date."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
         # Create a simple migrations table if it doesn't exist
         try:
             with self.cursor() as cursor:
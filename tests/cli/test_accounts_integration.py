@@ -1,5 +1,10 @@
 """Integration tests for account CLI flows."""
 
+import csv
+import io
+import json
+from pathlib import Path
+
 from click.testing import CliRunner
 
 from niveshpy.cli.main import cli
@@ -23,6 +28,38 @@ def test_accounts_add_list_filter_and_pagination(cli_scenario: CliScenario) -> N
     assert paged[0]["name"] == "Beta"
 
 
+def test_accounts_list_csv(cli_scenario: CliScenario, tmp_path: Path) -> None:
+    """Accounts can be exported as CSV to stdout or to a file."""
+    alpha_id = cli_scenario.add_account("Alpha", "HDFC")
+    beta_id = cli_scenario.add_account("Beta", "ICICI")
+
+    result = cli_scenario.invoke(["accounts", "list", "--csv"])
+    rows = list(csv.DictReader(io.StringIO(result.output.strip())))
+
+    assert [row["id"] for row in rows] == [str(alpha_id), str(beta_id)]
+    assert [row["name"] for row in rows] == ["Alpha", "Beta"]
+    assert list(rows[0]) == ["id", "name", "institution", "created", "source"]
+    assert rows[0]["source"] == "cli"
+
+    output_file = tmp_path / "accounts.csv"
+    cli_scenario.invoke(["accounts", "list", "--csv", "-o", str(output_file)])
+    with output_file.open(newline="") as f:
+        assert list(csv.DictReader(f)) == rows
+
+
+def test_accounts_list_json_output_file(
+    cli_scenario: CliScenario, tmp_path: Path
+) -> None:
+    """Accounts written to a JSON file match the JSON printed to stdout."""
+    cli_scenario.add_account("Alpha", "HDFC")
+    accounts = cli_scenario.invoke_json(["accounts", "list"])
+
+    output_file = tmp_path / "accounts.json"
+    cli_scenario.invoke(["accounts", "list", "--json", "-o", str(output_file)])
+
+    assert json.loads(output_file.read_text()) == accounts
+
+
 def test_accounts_add_duplicate_returns_warning_and_does_not_duplicate(
     cli_scenario: CliScenario,
 ) -> None:
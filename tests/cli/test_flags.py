@@ -6,6 +6,7 @@ from click.testing import CliRunner
 
 from niveshpy.cli.utils import flags
 from niveshpy.cli.utils.models import OutputFormat
+from niveshpy.core.app import AppState
 
 
 @pytest.fixture
@@ -47,6 +48,17 @@ def dry_run_cmd(dry_run):
     click.echo(f"dry_run={dry_run}")
 
 
+@click.command()
+@flags.no_input()
+@flags.debug()
+@flags.no_color()
+@click.pass_context
+def state_flags_cmd(ctx):
+    """Test command with flags that update the application state."""
+    state = ctx.ensure_object(AppState)
+    click.echo(f"{state.no_input},{state.debug},{state.no_color}")
+
+
 # --- Test classes ---
 
 
@@ -158,3 +170,43 @@ class TestOtherFlags:
         result = runner.invoke(dry_run_cmd, [])
         assert result.exit_code == 0
         assert "dry_run=False" in result.output
+
+
+class TestStateFlags:
+    """Tests for flags stored on the application state."""
+
+    def test_defaults_leave_state_unchanged(self, runner):
+        """Without flags, the state keeps its defaults."""
+        result = runner.invoke(state_flags_cmd, [], env={"DEBUG": "", "NO_COLOR": ""})
+        assert result.exit_code == 0
+        assert result.output.strip() == "False,False,False"
+
+    def test_flags_set_state(self, runner):
+        """Each flag sets the matching state attribute."""
+        result = runner.invoke(state_flags_cmd, ["--no-input", "--debug", "--no-color"])
+        assert result.exit_code == 0
+        assert result.output.strip() == "True,True,True"
+
+    def test_flags_set_existing_state(self, runner):
+        """Flags update a state object that is already present on the context."""
+        state = AppState()
+        result = runner.invoke(state_flags_cmd, ["--no-input"], obj=state)
+        assert result.exit_code == 0
+        assert state.no_input is True
+        assert state.debug is False
+
+
+class TestFlagDecoratorReuse:
+    """Tests for reusing cached flag decorators."""
+
+    def test_same_arguments_return_same_decorator(self):
+        """Calling a flag factory with the same arguments reuses the decorator."""
+        assert flags.force() is flags.force()
+        assert flags.limit("items", default=10) is flags.limit("items", default=10)
+        assert flags.limit("items") is not flags.limit("accounts")
+
+    def test_shared_decorator_creates_independent_options(self):
+        """Each decorated command still gets its own Option instance."""
+        first = click.command("first")(flags.force()(lambda force: None))
+        second = click.command("second")(flags.force()(lambda force: None))
+        assert first.params[0] is not second.params[0]
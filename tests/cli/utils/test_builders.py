@@ -0,0 +1,113 @@
+"""Tests for niveshpy.cli.utils.builders."""
+
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from niveshpy.cli.utils.builders import build_csv, build_table, csv_rows, json_data
+from niveshpy.cli.utils.models import Column, Row, SectionBreak, TotalRow
+
+
+@dataclass
+class Item:
+    """Simple item used as table input."""
+
+    name: str
+    amount: int
+
+
+def _cells(table) -> list[list[str]]:
+    """Return table cells as a list of rows."""
+    columns = [list(column.cells) for column in table.columns]
+    return [list(row) for row in zip(*columns, strict=True)]
+
+
+class TestBuildTable:
+    """Tests for the build_table function."""
+
+    def test_plain_items_use_getter_and_formatter(self) -> None:
+        """Cells are read by key or getter and passed through the formatter."""
+        columns = [
+            Column("name", getter=lambda item: item.name.upper()),
+            Column("amount", formatter=lambda value: f"{value:,}"),
+        ]
+        table = build_table([Item("a", 1000), Item("b", 2)], columns)
+
+        assert [column.header for column in table.columns] == ["Name", "Amount"]
+        assert _cells(table) == [["A", "1,000"], ["B", "2"]]
+
+    def test_missing_attribute_is_none(self) -> None:
+        """Columns without a matching attribute receive None."""
+        table = build_table([Item("a", 1)], [Column("missing")])
+        assert _cells(table) == [["None"]]
+
+    def test_markers(self) -> None:
+        """Section breaks, total rows and styled rows are rendered."""
+        columns = [Column("name"), Column("amount"), Column("amount", name="Total")]
+        items = [
+            Item("a", 1),
+            SectionBreak(),
+            Row(Item("b", 2), override_style="red"),
+            TotalRow("3"),
+        ]
+        table = build_table(items, columns)
+
+        assert _cells(table) == [
+            ["a", "1", "1"],
+            ["b", "2", "2"],
+            ["Total", "", "3"],
+        ]
+        assert table.rows[0].end_section is True
+        assert table.rows[1].style == "red"
+        assert table.rows[2].style == "bold"
+
+
+class TestBuildCsv:
+    """Tests for the build_csv function."""
+
+    def test_returns_csv_string(self) -> None:
+        """CSV is returned as a string when no output file is given."""
+        rows = [{"name": "a", "amount": 1}, {"name": "b", "amount": 2}]
+        result = build_csv(rows, fields=["name", "amount"])
+        assert result == "name,amount\r\na,1\r\nb,2\r\n"
+
+    def test_writes_output_file(self, tmp_path: Path) -> None:
+        """CSV is written to the output file and nothing is returned."""
+        output_file = tmp_path / "out.csv"
+        result = build_csv(
+            [{"name": "a", "amount": 1}],
+            fields=["name", "amount"],
+            output_file=output_file,
+        )
+        assert result is None
+        assert output_file.read_text() == "name,amount\na,1\n"
+
+    def test_missing_keys_are_empty(self) -> None:
+        """Missing keys are written as empty values."""
+        rows = [{"name": "a"}, {"name": "b", "amount": 2}]
+        result = build_csv(rows, fields=["name", "amount"])
+        assert result == "name,amount\r\na,\r\nb,2\r\n"
+
+    def test_extra_keys_raise(self) -> None:
+        """Keys missing from the field list raise instead of being dropped."""
+        rows = [{"name": "a", "amount": 1, "extra": "x"}]
+        with pytest.raises(ValueError, match="'extra'"):
+            build_csv(rows, fields=["name", "amount"])
+
+
+class TestConverterHelpers:
+    """Tests for the csv_rows and json_data helpers."""
+
+    def test_csv_rows_is_lazy(self) -> None:
+        """Rows are unstructured only as they are consumed."""
+        rows = csv_rows(iter([{"amount": Decimal("1.50")}]))
+        assert not isinstance(rows, list)
+        assert next(rows) == {"amount": Decimal("1.50")}
+
+    def test_json_data_uses_json_converter(self) -> None:
+        """Dates and decimals are unstructured into JSON-compatible values."""
+        data = json_data({"date": datetime.date(2024, 1, 2), "amount": Decimal("1.5")})
+        assert data == {"date": "2024-01-02", "amount": "1.5"}
@@ -0,0 +1,189 @@
+"""Tests for niveshpy.cli.utils.display."""
+
+import io
+import json
+from unittest.mock import patch
+
+from rich.console import Console
+
+from niveshpy.cli.utils.display import (
+    MAX_HIGHLIGHT_LENGTH,
+    capture_for_pager,
+    display_json,
+)
+
+DATA = [{"id": 1, "name": "Ünïcode " + "x" * 100, "empty": None, "flag": True}]
+
+
+class TestDisplayJson:
+    """Tests for the display_json function."""
+
+    def test_non_terminal_matches_rich_output(self) -> None:
+        """Plain output is identical to what Rich prints without a terminal."""
+        expected = io.StringIO()
+        Console(file=expected).print_json(data=DATA)
+
+        actual = io.StringIO()
+        display_json(data=DATA, console=Console(file=actual))
+
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_non_terminal_json_string(self) -> None:
+        """A JSON string is re-indented the same way as Rich does."""
+        expected = io.StringIO()
+        Console(file=expected).print_json('{"a": [1, 2]}')
+
+        actual = io.StringIO()
+        display_json('{"a": [1, 2]}', console=Console(file=actual))
+
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_non_terminal_output_is_captured(self) -> None:
+        """Plain output goes through the console, so capture still sees it."""
+        output = io.StringIO()
+        console = Console(file=output)
+        with console.capture() as capture:
+            display_json(data={"note": "[bold]:smile:[/bold]"}, console=console)
+
+        assert output.getvalue() == ""
+        assert json.loads(capture.get()) == {"note": "[bold]:smile:[/bold]"}
+
+    def test_terminal_output_is_highlighted(self) -> None:
+        """Terminal output still goes through Rich's JSON highlighting."""
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, color_system="standard")
+        display_json(data=DATA, console=console)
+
+        assert "\x1b[" in output.getvalue()
+
+    def test_terminal_output_matches_rich(self) -> None:
+        """Highlighted terminal output is identical to Console.print_json."""
+        expected = io.StringIO()
+        Console(file=expected, force_terminal=True, color_system="standard").print_json(
+            data=DATA
+        )
+
+        actual = io.StringIO()
+        console = Console(file=actual, force_terminal=True, color_system="standard")
+        display_json(data=DATA, console=console)
+
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_terminal_json_string_matches_rich(self) -> None:
+        """A JSON string on a terminal is highlighted exactly like print_json."""
+        expected = io.StringIO()
+        Console(file=expected, force_terminal=True, color_system="standard").print_json(
+            '{"a": [1, 2]}'
+        )
+
+        actual = io.StringIO()
+        console = Console(file=actual, force_terminal=True, color_system="standard")
+        display_json('{"a": [1, 2]}', console=console)
+
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_terminal_serializes_data_once(self) -> None:
+        """Data is dumped once and its text is handed to print_json."""
+        console = Console(file=io.StringIO(), force_terminal=True)
+        with (
+            patch("json.dumps", wraps=json.dumps) as dumps,
+            patch.object(console, "print_json") as print_json,
+        ):
+            display_json(data=DATA, console=console)
+
+        dumps.assert_called_once()
+        print_json.assert_called_once_with(
+            json.dumps(DATA, indent=2, ensure_ascii=False)
+        )
+
+    def test_large_terminal_output_is_not_highlighted(self) -> None:
+        """Payloads over the size limit are printed as plain text."""
+        data = [{"name": "x" * MAX_HIGHLIGHT_LENGTH}]
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, color_system="standard")
+        display_json(data=data, console=console)
+
+        assert "\x1b[" not in output.getvalue()
+        assert json.loads(output.getvalue()) == data
+
+
+class TestCaptureForPager:
+    """Tests for the capture_for_pager context manager."""
+
+    @staticmethod
+    def _terminal_console(output: io.StringIO) -> Console:
+        return Console(file=output, force_terminal=True, height=10, width=40)
+
+    def test_short_output_is_written_directly(self) -> None:
+        """Output that fits on one screen is printed without the pager."""
+        output = io.StringIO()
+        console = self._terminal_console(output)
+        with patch("click.echo_via_pager") as pager:
+            with capture_for_pager(console=console):
+                console.print("hello")
+
+        pager.assert_not_called()
+        assert output.getvalue() == "hello\n"
+
+    def test_long_output_uses_pager(self) -> None:
+        """Output taller than the screen is sent through the pager."""
+        output = io.StringIO()
+        console = self._terminal_console(output)
+        with patch("click.echo_via_pager") as pager:
+            with capture_for_pager(console=console):
+                for i in range(20):
+                    console.print(f"line {i}")
+
+        pager.assert_called_once()
+        assert pager.call_args.args[0].count("\n") == 20
+        assert output.getvalue() == ""
+
+    def test_wrapped_output_uses_pager(self) -> None:
+        """Few long lines that wrap past the screen height still use the pager."""
+        output = io.StringIO()
+        console = self._terminal_console(output)
+        with patch("click.echo_via_pager") as pager:
+            with capture_for_pager(console=console):
+                for _ in range(3):
+                    console.print("x" * 150, soft_wrap=True)
+
+        pager.assert_called_once()
+        assert output.getvalue() == ""
+
+    def test_styled_output_height_ignores_escape_codes(self) -> None:
+        """ANSI styling does not count towards the rendered line width."""
+        output = io.StringIO()
+        console = self._terminal_console(output)
+        with patch("click.echo_via_pager") as pager:
+            with capture_for_pager(console=console):
+                for _ in range(5):
+                    console.print("[bold red]" + "x" * 38 + "[/bold red]")
+
+        pager.assert_not_called()
+
+    def test_tall_output_skips_measuring(self) -> None:
+        """Output with more lines than the screen is paged without decoding it."""
+        output = io.StringIO()
+        console = self._terminal_console(output)
+        with (
+            patch("click.echo_via_pager") as pager,
+            patch("rich.text.Text.from_ansi") as from_ansi,
+        ):
+            with capture_for_pager(console=console):
+                for i in range(20):
+                    console.print(f"line {i}")
+
+        pager.assert_called_once()
+        from_ansi.assert_not_called()
+
+    def test_non_terminal_is_not_captured(self) -> None:
+        """Output is printed directly when the console is not a terminal."""
+        output = io.StringIO()
+        console = Console(file=output)
+        with patch("click.echo_via_pager") as pager:
+            with capture_for_pager(console=console):
+                for i in range(20):
+                    console.print(f"line {i}")
+
+        pager.assert_not_called()
+        assert output.getvalue().count("\n") == 20
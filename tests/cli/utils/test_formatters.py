@@ -2,6 +2,7 @@
 
 import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
@@ -9,7 +10,11 @@ from niveshpy.cli.utils.formatters import (
     format_datetime,
     format_decimal,
     format_percentage,
+    format_security_category,
+    format_security_type,
+    relative_datetime_formatter,
 )
+from niveshpy.models.security import SecurityCategory, SecurityType
 from niveshpy.models.transaction import TransactionType
 
 
@@ -99,6 +104,31 @@ class TestFormatDatetime:
         expected_date = dt.strftime("%d %b %Y")
         assert result == f"on {expected_date}"
 
+    def test_fixed_reference_time(self) -> None:
+        """An explicit reference time is used instead of the current time."""
+        now = datetime.datetime(2024, 1, 10, 12, 0, 0)
+        assert (
+            format_datetime(datetime.datetime(2024, 1, 10, 9, 0, 0), now=now)
+            == "about 3 hours ago"
+        )
+        assert (
+            format_datetime(datetime.datetime(2023, 12, 1, 9, 0, 0), now=now)
+            == "on 01 Dec 2023"
+        )
+
+    def test_relative_datetime_formatter_captures_now_once(self) -> None:
+        """The factory reads the clock once and reuses it for every call."""
+        fixed_now = datetime.datetime(2024, 1, 10, 12, 0, 0)
+        with patch("niveshpy.cli.utils.formatters.datetime") as mock_datetime:
+            mock_datetime.datetime.now.return_value = fixed_now
+            formatter = relative_datetime_formatter()
+
+        assert formatter(datetime.datetime(2024, 1, 10, 9, 0, 0)) == "about 3 hours ago"
+        assert (
+            formatter(datetime.datetime(2024, 1, 10, 11, 0, 0)) == "about 1 hours ago"
+        )
+        mock_datetime.datetime.now.assert_called_once_with()
+
 
 @pytest.mark.parametrize(
     "transaction_type, expected_output",
@@ -115,3 +145,30 @@ def test_format_transaction_type(transaction_type, expected_output) -> None:
     from niveshpy.cli.utils.formatters import format_transaction_type
 
     assert format_transaction_type(transaction_type) == expected_output
+
+
+@pytest.mark.parametrize(
+    "security_type, expected_output",
+    [
+        (SecurityType.MUTUAL_FUND, "[green]Mutual Fund"),
+        ("stock", "[white]Stock"),
+        ("warrant", "[reverse]Unknown"),
+        (None, "[reverse]Unknown"),
+    ],
+)
+def test_format_security_type(security_type, expected_output) -> None:
+    """Test formatting of SecurityType values."""
+    assert format_security_type(security_type) == expected_output
+
+
+@pytest.mark.parametrize(
+    "category, expected_output",
+    [
+        (SecurityCategory.DEBT, "[cyan]Debt"),
+        ("real_estate", "[bright_red]Real Estate"),
+        ("crypto", "[reverse]Unknown"),
+    ],
+)
+def test_format_security_category(category, expected_output) -> None:
+    """Test formatting of SecurityCategory values."""
+    assert format_security_category(category) == expected_output
@@ -0,0 +1,36 @@
+"""Tests for CLI input utilities."""
+
+import pytest
+
+from niveshpy.cli.utils.inputs import validate_date
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-15", "2024-1-5", "2024-02-29", "0001-01-01", "9999-12-31"],
+)
+def test_validate_date_accepts_valid_dates(value):
+    """Test that valid YYYY-MM-DD dates are accepted."""
+    assert validate_date(value) is True
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2024",
+        "2024-13-01",
+        "2023-02-29",
+        "2024-00-10",
+        "2024-01-32",
+        "24-01-15",
+        "2024/01/15",
+        "20240115",
+        "2024-01-15T00:00",
+        " 2024-01-15",
+        "2024-01-15\n",
+    ],
+)
+def test_validate_date_rejects_invalid_dates(value):
+    """Test that malformed or impossible dates are rejected."""
+    assert validate_date(value) is False
@@ -0,0 +1,59 @@
+"""Tests for niveshpy.cli.utils.logging."""
+
+import logging
+import sys
+from pathlib import Path
+
+from niveshpy.cli.utils.logging import (
+    DeferredRotatingFileHandler,
+    TracebackInfoFilter,
+)
+
+
+class TestDeferredRotatingFileHandler:
+    """Tests for the DeferredRotatingFileHandler class."""
+
+    def test_no_file_io_before_first_record(self, tmp_path: Path) -> None:
+        """Neither the log directory nor the file is created on construction."""
+        log_path = tmp_path / "logs" / "niveshpy.log"
+        handler = DeferredRotatingFileHandler(log_path, max_bytes=1024, backup_count=1)
+        try:
+            assert not log_path.parent.exists()
+        finally:
+            handler.close()
+
+    def test_creates_directory_and_file_on_first_record(self, tmp_path: Path) -> None:
+        """The log directory and file are created when a record is emitted."""
+        log_path = tmp_path / "logs" / "niveshpy.log"
+        handler = DeferredRotatingFileHandler(log_path, max_bytes=1024, backup_count=1)
+        try:
+            record = logging.makeLogRecord({"msg": "hello", "levelno": logging.INFO})
+            handler.handle(record)
+            handler.flush()
+            assert log_path.read_text().strip() == "hello"
+        finally:
+            handler.close()
+
+
+class TestTracebackInfoFilter:
+    """Tests for the TracebackInfoFilter class."""
+
+    def test_record_without_exception_is_untouched(self) -> None:
+        """Records without exception info pass through unchanged."""
+        record = logging.makeLogRecord({"msg": "hello"})
+        assert TracebackInfoFilter().filter(record) is True
+        assert not hasattr(record, "_exc_info_hidden")
+
+    def test_exception_info_is_hidden(self) -> None:
+        """Exception info is moved off the record so no traceback is rendered."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.makeLogRecord({"msg": "failed", "exc_info": exc_info})
+        record.exc_text = "Traceback ..."
+
+        assert TracebackInfoFilter().filter(record) is True
+        assert record.exc_info is None
+        assert record.exc_text is None
+        assert record._exc_info_hidden == exc_info
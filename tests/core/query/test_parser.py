@@ -160,6 +160,21 @@ def test_parse_field_keywords(parse_query, query, expected_filter):
     assert filters[0] == expected_filter
 
 
+@pytest.mark.parametrize(
+    "query,expected_value",
+    [
+        ("desc:refund: order 12", "refund: order 12"),
+        ("desc:amt:100..200", "amt:100..200"),
+        ("acct:", ""),
+    ],
+    ids=["colon", "keyword", "empty"],
+)
+def test_parse_field_keywords_keep_text_verbatim(parse_query, query, expected_value):
+    """Test field keyword values are the rest of the query exactly as typed."""
+    (filter_node,) = parse_query(query)
+    assert filter_node.value == expected_value
+
+
 @pytest.mark.parametrize(
     "query,expected_filters",
     [
@@ -246,8 +261,10 @@ def test_parse_negation(parse_query, query, expected_filters):
         ("grocery", 1, "grocery"),
         ("grocery store payment", 1, "grocery store payment"),
         ("", 0, None),
+        ("note:date:2024", 1, "note:date:2024"),
+        ("100..200 >= x", 1, "100..200 >= x"),
     ],
-    ids=["single_word", "multiple_words", "empty"],
+    ids=["single_word", "multiple_words", "empty", "keyword_inside", "symbols"],
 )
 def test_parse_text_queries(parse_query, query, expected_count, expected_value):
     """Test parsing plain text and empty queries."""
@@ -348,6 +365,30 @@ def test_get_operator_from_token_error():
         parser.get_operator_from_token(Literal("x"))
 
 
+@pytest.mark.parametrize(
+    "query,expected_count,expected_index",
+    [
+        ("100..200", 3, 1),
+        ("..200", 2, 0),
+        ("100..", 2, 1),
+        ("1..2..3", 5, 1),
+        ("100", 1, -1),
+        ("", 0, -1),
+    ],
+)
+def test_get_remaining_tokens_with_separator(query, expected_count, expected_index):
+    """Test reading remaining tokens also reports the first range separator."""
+    from niveshpy.core.query.parser import QueryParser
+    from niveshpy.core.query.tokenizer import QueryLexer
+
+    tokens, sep_index = QueryParser(
+        QueryLexer(query)
+    ).get_remaining_tokens_with_separator()
+
+    assert len(tokens) == expected_count
+    assert sep_index == expected_index
+
+
 class TestConvertToString:
     """Test convert_to_string with various token types."""
 
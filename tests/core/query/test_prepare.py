@@ -8,7 +8,9 @@ import pytest
 from niveshpy.core.query.prepare import (
     combine_filters,
     get_fields_from_queries,
+    get_prepared_filters_from_queries,
     group_filters,
+    parse_query,
     prepare_filters,
 )
 from niveshpy.domain.query.ast import Field, FilterNode, Operator
@@ -156,6 +158,29 @@ class TestCombineFilters:
         assert len(combined) == 1
         assert combined[0] == filters[0]
 
+    def test_single_equals_not_converted_to_in(self):
+        """Test that a lone equality filter is kept as EQUALS."""
+        filters = [FilterNode(Field.AMOUNT, Operator.EQUALS, Decimal("100"))]
+
+        combined = combine_filters(Field.AMOUNT, filters)
+
+        assert combined == filters
+
+    def test_single_combinable_filter_per_operator(self):
+        """Test that only operators with several filters are merged."""
+        filters = [
+            FilterNode(Field.DATE, Operator.NOT_EQUALS, date(2024, 1, 1)),
+            FilterNode(Field.DATE, Operator.EQUALS, date(2024, 2, 1)),
+            FilterNode(Field.DATE, Operator.EQUALS, date(2024, 3, 1)),
+        ]
+
+        combined = combine_filters(Field.DATE, filters)
+
+        assert combined == [
+            FilterNode(Field.DATE, Operator.NOT_EQUALS, date(2024, 1, 1)),
+            FilterNode(Field.DATE, Operator.IN, (date(2024, 2, 1), date(2024, 3, 1))),
+        ]
+
 
 class TestPrepareFilters:
     """Tests for prepare_filters function."""
@@ -249,3 +274,34 @@ class TestGetFieldsFromQueries:
 
         # Verify exception was raised with proper error information
         assert "Invalid token sequence" in str(exc_info.value)
+
+
+class TestParseQuery:
+    """Test parse_query function."""
+
+    def test_parse_returns_tuple(self):
+        """Test that a query is parsed into an immutable tuple of nodes."""
+        result = parse_query("amt:100")
+
+        assert result == (FilterNode(Field.AMOUNT, Operator.EQUALS, Decimal("100")),)
+
+    def test_repeated_query_is_cached(self):
+        """Test that parsing the same query again reuses the cached result."""
+        parse_query.cache_clear()
+
+        first = parse_query("acct:savings")
+        second = parse_query("acct:savings")
+
+        assert first is second
+        assert parse_query.cache_info().hits == 1
+
+    def test_fields_and_filters_share_parse(self):
+        """Test that fields and filters for the same queries parse only once."""
+        parse_query.cache_clear()
+        queries = ("date:2024", "  sec:gold  ")
+
+        get_prepared_filters_from_queries(queries, Field.SECURITY)
+        get_fields_from_queries(queries)
+
+        assert parse_query.cache_info().misses == 2
+        assert parse_query.cache_info().hits == 2
@@ -3,7 +3,7 @@
 import pytest
 
 from niveshpy.core.query.tokenizer import QueryLexer
-from niveshpy.core.query.tokens import End, Int, Keyword, Literal
+from niveshpy.core.query.tokens import Colon, Dash, End, Int, Keyword, Literal
 
 
 def test_tokenize_simple_literal():
@@ -90,3 +90,19 @@ class TestDotTokenization:
         assert isinstance(token1, Dot)
         assert isinstance(token2, Literal)
         assert token2.value == "x"
+
+
+@pytest.mark.parametrize(
+    "query,expected_tokens",
+    [
+        ("monthly sip", [Literal("monthly sip"), End()]),
+        ("foo bar:baz", [Literal("foo bar"), Colon(), Literal("baz"), End()]),
+        ("x:", [Literal("x"), Colon(), End()]),
+        ("2024-01", [Int("2024"), Dash(), Int("01"), End()]),
+        ("12ab", [Int("12"), Literal("ab"), End()]),
+    ],
+    ids=["spaces", "colon", "trailing-colon", "ints", "int-then-literal"],
+)
+def test_tokenize_literal_and_int_boundaries(query, expected_tokens):
+    """Test literals run up to the next colon and integers stop at a non-digit."""
+    assert list(QueryLexer(query)) == expected_tokens
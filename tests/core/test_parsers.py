@@ -26,7 +26,7 @@ class MockParserFactory:
         )
 
     @classmethod
-    def create_parser(cls, file_path, password=None):
+    def create_parser(cls, file_path, password=None, **kwargs):
         """Create a mock parser."""
         return MagicMock()
 
@@ -42,7 +42,7 @@ class AnotherMockParserFactory:
         )
 
     @classmethod
-    def create_parser(cls, file_path, password=None):
+    def create_parser(cls, file_path, password=None, **kwargs):
         """Create another mock parser."""
         return MagicMock()
 
@@ -50,15 +50,17 @@ class AnotherMockParserFactory:
 @pytest.fixture(autouse=True)
 def clean_registry():
     """Clear parser registry and caches before and after each test."""
-    from niveshpy.core import parsers
+    from niveshpy.core import _entrypoints, parsers
 
     parsers._REGISTERED_PARSERS.clear()
-    parsers.list_parsers.cache_clear()
+    parsers._SORTED_PARSER_KEYS.clear()
     parsers.list_parsers_starting_with.cache_clear()
+    _entrypoints.get_entry_points.cache_clear()
     yield
     parsers._REGISTERED_PARSERS.clear()
-    parsers.list_parsers.cache_clear()
+    parsers._SORTED_PARSER_KEYS.clear()
     parsers.list_parsers_starting_with.cache_clear()
+    _entrypoints.get_entry_points.cache_clear()
 
 
 class TestRegisterParser:
@@ -121,6 +123,27 @@ class TestListParsers:
         assert MockParserFactory in result
         assert AnotherMockParserFactory in result
 
+    def test_list_returns_fresh_list(self):
+        """Test that callers can extend the returned list without touching the registry."""
+        register_parser("mock_parser", MockParserFactory)
+
+        result = list_parsers()
+        assert isinstance(result, list)
+        result.append(result[0])
+
+        assert len(list_parsers()) == 1
+
+    def test_list_reflects_later_registration(self):
+        """Test that registering after listing updates the listed parsers."""
+        register_parser("mock_parser", MockParserFactory)
+        assert len(list_parsers()) == 1
+
+        register_parser("another_parser", AnotherMockParserFactory)
+
+        result = list_parsers()
+        assert len(result) == 2
+        assert AnotherMockParserFactory in result
+
     def test_list_starting_with_prefix(self):
         """Test filtering parsers by key prefix."""
         register_parser("cas_pdf", MockParserFactory)
@@ -140,6 +163,28 @@ class TestListParsers:
         result = list_parsers_starting_with("zzz_")
         assert result == []
 
+    def test_list_starting_with_sorted_and_bounded(self):
+        """Test prefix matches are sorted and exclude neighbouring keys."""
+        register_parser("cas_pdf", MockParserFactory)
+        register_parser("ca", MockParserFactory)
+        register_parser("cas", MockParserFactory)
+        register_parser("cat", AnotherMockParserFactory)
+        register_parser("cas_csv", AnotherMockParserFactory)
+
+        keys = [key for key, _ in list_parsers_starting_with("cas")]
+        assert keys == ["cas", "cas_csv", "cas_pdf"]
+
+    def test_list_starting_with_empty_prefix(self):
+        """Test an empty prefix lists every parser in key order."""
+        register_parser("zeta", MockParserFactory)
+        register_parser("alpha", AnotherMockParserFactory)
+
+        result = list_parsers_starting_with("")
+        assert result == [
+            ("alpha", AnotherMockParserFactory),
+            ("zeta", MockParserFactory),
+        ]
+
 
 class TestDiscoverInstalledParsers:
     """Test discover_installed_parsers function."""
@@ -195,19 +240,34 @@ class TestDiscoverInstalledParsers:
         mock_ep.name = "specific_parser"
         mock_ep.load.return_value = MockParserFactory
 
-        # First select(group=...) returns an object, second select(name=...) filters further
-        inner_eps = MagicMock()
-        inner_eps.select.return_value = inner_eps
-        inner_eps.__iter__ = lambda self: iter([mock_ep])
+        named_eps = MagicMock()
+        named_eps.__iter__ = lambda self: iter([mock_ep])
 
-        outer_eps = MagicMock()
-        outer_eps.select.return_value = inner_eps
+        group_eps = MagicMock()
+        group_eps.select.return_value = named_eps
 
-        with patch("importlib.metadata.entry_points", return_value=outer_eps):
+        with patch(
+            "importlib.metadata.entry_points", return_value=group_eps
+        ) as entry_points:
             discover_installed_parsers(name="specific_parser")
 
         assert get_parser("specific_parser") is MockParserFactory
-        inner_eps.select.assert_called_once_with(name="specific_parser")
+        entry_points.assert_called_once_with(group="niveshpy.parsers")
+        group_eps.select.assert_called_once_with(name="specific_parser")
+
+    def test_discover_reads_metadata_once(self):
+        """Test that repeated discovery reuses the installed entry points."""
+        mock_eps = MagicMock()
+        mock_eps.select.return_value = mock_eps
+        mock_eps.__iter__ = lambda self: iter([])
+
+        with patch(
+            "importlib.metadata.entry_points", return_value=mock_eps
+        ) as entry_points:
+            discover_installed_parsers()
+            discover_installed_parsers(name="other")
+
+        entry_points.assert_called_once_with(group="niveshpy.parsers")
 
     def test_discover_clears_existing(self):
         """Test that discover clears previously registered parsers."""
@@ -224,6 +284,20 @@ class TestDiscoverInstalledParsers:
         assert get_parser("old_parser") is None
         assert is_empty() is True
 
+    def test_discover_nothing_clears_prefix_cache(self):
+        """Test that discovering no entry points leaves no stale prefix results."""
+        register_parser("cached_parser", MockParserFactory)
+        assert len(list_parsers_starting_with("cached")) == 1
+
+        mock_eps = MagicMock()
+        mock_eps.select.return_value = mock_eps
+        mock_eps.__iter__ = lambda self: iter([])
+
+        with patch("importlib.metadata.entry_points", return_value=mock_eps):
+            discover_installed_parsers()
+
+        assert list_parsers_starting_with("cached") == []
+
     def test_discover_clears_cache(self):
         """Test that discover clears the list_parsers cache."""
         register_parser("cached_parser", MockParserFactory)
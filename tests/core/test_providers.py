@@ -46,15 +46,17 @@ class AnotherMockProviderFactory:
 @pytest.fixture(autouse=True)
 def clean_registry():
     """Clear provider registry and caches before and after each test."""
-    from niveshpy.core import providers
+    from niveshpy.core import _entrypoints, providers
 
     providers._REGISTERED_PROVIDERS.clear()
-    providers.list_providers.cache_clear()
+    providers._SORTED_PROVIDER_KEYS.clear()
     providers.list_providers_starting_with.cache_clear()
+    _entrypoints.get_entry_points.cache_clear()
     yield
     providers._REGISTERED_PROVIDERS.clear()
-    providers.list_providers.cache_clear()
+    providers._SORTED_PROVIDER_KEYS.clear()
     providers.list_providers_starting_with.cache_clear()
+    _entrypoints.get_entry_points.cache_clear()
 
 
 class TestRegisterProvider:
@@ -118,6 +120,27 @@ class TestListProviders:
         assert result_dict["mock_provider"] is MockProviderFactory
         assert result_dict["another_provider"] is AnotherMockProviderFactory
 
+    def test_list_returns_fresh_list(self):
+        """Test that callers can extend the returned list without touching the registry."""
+        register_provider("mock_provider", MockProviderFactory)
+
+        result = list_providers()
+        assert isinstance(result, list)
+        result.append(result[0])
+
+        assert len(list_providers()) == 1
+
+    def test_list_reflects_later_registration(self):
+        """Test that registering after listing updates the listed providers."""
+        register_provider("mock_provider", MockProviderFactory)
+        assert len(list_providers()) == 1
+
+        register_provider("another_provider", AnotherMockProviderFactory)
+
+        result = list_providers()
+        assert len(result) == 2
+        assert dict(result)["another_provider"] is AnotherMockProviderFactory
+
     def test_list_starting_with_prefix(self):
         """Test filtering providers by key prefix."""
         register_provider("amfi_v1", MockProviderFactory)
@@ -137,6 +160,28 @@ class TestListProviders:
         result = list_providers_starting_with("zzz_")
         assert result == []
 
+    def test_list_starting_with_sorted_and_bounded(self):
+        """Test prefix matches are sorted and exclude neighbouring keys."""
+        register_provider("cas_pdf", MockProviderFactory)
+        register_provider("ca", MockProviderFactory)
+        register_provider("cas", MockProviderFactory)
+        register_provider("cat", AnotherMockProviderFactory)
+        register_provider("cas_csv", AnotherMockProviderFactory)
+
+        keys = [key for key, _ in list_providers_starting_with("cas")]
+        assert keys == ["cas", "cas_csv", "cas_pdf"]
+
+    def test_list_starting_with_empty_prefix(self):
+        """Test an empty prefix lists every provider in key order."""
+        register_provider("zeta", MockProviderFactory)
+        register_provider("alpha", AnotherMockProviderFactory)
+
+        result = list_providers_starting_with("")
+        assert result == [
+            ("alpha", AnotherMockProviderFactory),
+            ("zeta", MockProviderFactory),
+        ]
+
 
 class TestDiscoverInstalledProviders:
     """Test discover_installed_providers function."""
@@ -163,18 +208,34 @@ class TestDiscoverInstalledProviders:
         mock_ep.name = "specific_provider"
         mock_ep.load.return_value = MockProviderFactory
 
-        inner_eps = MagicMock()
-        inner_eps.select.return_value = inner_eps
-        inner_eps.__iter__ = lambda self: iter([mock_ep])
+        named_eps = MagicMock()
+        named_eps.__iter__ = lambda self: iter([mock_ep])
 
-        outer_eps = MagicMock()
-        outer_eps.select.return_value = inner_eps
+        group_eps = MagicMock()
+        group_eps.select.return_value = named_eps
 
-        with patch("importlib.metadata.entry_points", return_value=outer_eps):
+        with patch(
+            "importlib.metadata.entry_points", return_value=group_eps
+        ) as entry_points:
             discover_installed_providers(name="specific_provider")
 
         assert get_provider("specific_provider") is MockProviderFactory
-        inner_eps.select.assert_called_once_with(name="specific_provider")
+        entry_points.assert_called_once_with(group="niveshpy.providers.price")
+        group_eps.select.assert_called_once_with(name="specific_provider")
+
+    def test_discover_reads_metadata_once(self):
+        """Test that repeated discovery reuses the installed entry points."""
+        mock_eps = MagicMock()
+        mock_eps.select.return_value = mock_eps
+        mock_eps.__iter__ = lambda self: iter([])
+
+        with patch(
+            "importlib.metadata.entry_points", return_value=mock_eps
+        ) as entry_points:
+            discover_installed_providers()
+            discover_installed_providers(name="other")
+
+        entry_points.assert_called_once_with(group="niveshpy.providers.price")
 
     def test_discover_clears_existing(self):
         """Test that discover clears previously registered providers."""
@@ -191,6 +252,20 @@ class TestDiscoverInstalledProviders:
         assert get_provider("old_provider") is None
         assert is_empty() is True
 
+    def test_discover_nothing_clears_prefix_cache(self):
+        """Test that discovering no entry points leaves no stale prefix results."""
+        register_provider("cached_provider", MockProviderFactory)
+        assert len(list_providers_starting_with("cached")) == 1
+
+        mock_eps = MagicMock()
+        mock_eps.select.return_value = mock_eps
+        mock_eps.__iter__ = lambda self: iter([])
+
+        with patch("importlib.metadata.entry_points", return_value=mock_eps):
+            discover_installed_providers()
+
+        assert list_providers_starting_with("cached") == []
+
     def test_discover_clears_cache(self):
         """Test that discover clears the list_providers cache."""
         register_provider("cached_provider", MockProviderFactory)
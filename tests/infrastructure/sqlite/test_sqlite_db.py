@@ -7,7 +7,12 @@ from pathlib import Path
 import pytest
 
 from niveshpy.exceptions import DatabaseError, IntegrityError
-from niveshpy.infrastructure.sqlite.sqlite_db import SqliteDatabase, _iregexp
+from niveshpy.infrastructure.sqlite.sqlite_db import (
+    SqliteDatabase,
+    _compile_iregexp,
+    _iregexp,
+    _optimize_and_close,
+)
 
 # ---------------------------------------------------------------------------
 # _iregexp function
@@ -79,6 +84,17 @@ class TestIregexpFunction:
         assert _iregexp("₹", "₹1000") is True
         assert _iregexp("😀", "hello 😀") is True
 
+    def test_pattern_compiled_once(self):
+        """Test each distinct pattern is compiled once and reused across rows."""
+        _compile_iregexp.cache_clear()
+
+        for value in ("Savings", "Current", "savings plus"):
+            _iregexp("savings", value)
+
+        info = _compile_iregexp.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
     def test_multiline_strings(self):
         """Test _iregexp with multiline strings."""
         value = "line1\nline2\nline3"
@@ -249,6 +265,10 @@ class TestSqliteDatabase:
             "account_id",
         }.issubset(_get_column_names(memory_db, '"transaction"'))
 
+    def test_writes_begin_immediate_transactions(self, memory_db):
+        """Test that implicit write transactions take the write lock up front."""
+        assert memory_db.connection.isolation_level == "IMMEDIATE"
+
     def test_row_factory_set(self, memory_db):
         """Test that row_factory is set to sqlite3.Row."""
         assert memory_db.connection.row_factory is sqlite3.Row
@@ -262,6 +282,32 @@ class TestSqlitePragma:
         result = memory_db.connection.execute("PRAGMA foreign_keys").fetchone()
         assert result[0] == 1
 
+    def test_performance_pragmas_applied(self, memory_db):
+        """Test that connection tuning PRAGMAs are applied on connect."""
+        conn = memory_db.connection
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16384
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_wal_journal_mode_on_file_db(self, tmp_path):
+        """Test that file-backed databases use write-ahead logging."""
+        db = SqliteDatabase(db_path=tmp_path / "niveshpy.db")
+        result = db.connection.execute("PRAGMA journal_mode").fetchone()
+        assert result[0] == "wal"
+
+    def test_optimize_and_close(self, memory_db):
+        """Test that the exit hook closes the connection after optimizing."""
+        conn = memory_db.connection
+        _optimize_and_close(conn)
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_optimize_and_close_on_closed_connection(self, memory_db):
+        """Test that the exit hook tolerates an already closed connection."""
+        conn = memory_db.connection
+        conn.close()
+        _optimize_and_close(conn)
+
     def test_iregexp_available(self, memory_db):
         """Test that iregexp function is registered and available."""
         result = memory_db.connection.execute(
@@ -269,6 +315,12 @@ class TestSqlitePragma:
         ).fetchone()
         assert result[0] == 1
 
+    def test_iregexp_is_deterministic(self, memory_db):
+        """Test that iregexp is registered as deterministic and usable in indexes."""
+        memory_db.connection.execute(
+            "CREATE INDEX ix_account_name_re ON account (iregexp('^a', name))"
+        )
+
     def test_foreign_key_constraint_enforced(self, memory_db):
         """Test that foreign key violation raises an error."""
         with pytest.raises(IntegrityError):